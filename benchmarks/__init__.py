@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+
+Benchmarks for the overhead of the decorators and all checking_typing_* functions.
+
+    python -m benchmarks --output results.json
+"""
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import bench_checking, bench_decorators, bench_import
+from benchmarks.runner import compare, write_json
+
+GROUPS = {
+    bench_decorators.GROUP: bench_decorators.run,
+    bench_checking.GROUP: bench_checking.run,
+    bench_import.GROUP: bench_import.run,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="benchmarks of strongtyping"
+    )
+    parser.add_argument("-o", "--output", help="json file for the results, default stdout")
+    parser.add_argument("--group", choices=sorted(GROUPS), action="append", help="default all")
+    parser.add_argument("--max-size", type=int, default=bench_checking.SIZES[-1])
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", metavar="BASELINE", help="json file of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="allowed ratio between the current and the baseline timing",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = []
+    for group in args.group or GROUPS:
+        results += GROUPS[group](min_time=args.min_time, repeat=args.repeat, max_size=args.max_size)
+    write_json(results, args.output)
+
+    exceeded = bench_import.over_budget(results)
+    for entry in exceeded:
+        print(
+            f"{entry['group']} {entry['name']}: {entry['min']:.3e}s "
+            f"exceeds the budget of {entry['budget']:.3e}s",
+            file=sys.stderr,
+        )
+    slower = bench_checking.slower_than_uncached(results)
+    for entry in slower:
+        print(
+            f"{entry['group']} {entry['name']} {entry['variant']}: "
+            f"{entry['uncached_ratio']:.2f}x slower than without a cache",
+            file=sys.stderr,
+        )
+    exceeded += slower
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(json.load(file), results, args.threshold)
+        for entry in regressions:
+            print(
+                f"{entry['group']} {entry['name']} {entry.get('variant') or entry.get('size')}: "
+                f"{entry['baseline']:.3e}s -> {entry['min']:.3e}s ({entry['ratio']:.2f}x)",
+                file=sys.stderr,
+            )
+        return int(bool(regressions or exceeded))
+    return int(bool(exceeded))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
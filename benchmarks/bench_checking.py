@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import json
+from contextlib import contextmanager
+from typing import Dict, List, Set, Tuple
+
+from benchmarks.runner import measure, result
+from strongtyping import strong_typing_utils as utils
+from strongtyping.strong_typing import match_typing
+from strongtyping.types import Validator
+
+GROUP = "checking"
+SIZES = tuple(10**exponent for exponent in range(7))
+
+
+def is_positive(value) -> bool:
+    return value >= 0
+
+
+def is_not_empty(value) -> bool:
+    return len(value) > 0
+
+
+def spell(name: int) -> str:
+    return str(name)
+
+
+@contextmanager
+def extension_disabled():
+    """
+    check_type uses the pure python functions while this context is active
+    """
+    modules = dict(utils.supported_modules)
+    utils.supported_modules.clear()
+    try:
+        yield
+    finally:
+        utils.supported_modules.update(modules)
+
+
+def sized_cases() -> dict:
+    """
+    :return: the checking functions, which need longer for larger arguments, and a function
+        which creates the benchmark for a payload of n elements
+    """
+
+    def typedict_values(n):
+        values = {f"key_{index}": index for index in range(n)}
+        required_types = dict.fromkeys(values, int)
+        return lambda: utils.checking_typing_typedict_values(values, required_types, True)
+
+    def payload_case(func, possible_types, payload_factory):
+        def create(n):
+            payload = payload_factory(n)
+            return lambda: func(payload, possible_types, False)
+
+        return create
+
+    def fixed_tuple(n):
+        payload = tuple(range(n))
+        possible_types = (int,) * n
+        return lambda: utils.checking_typing_tuple(payload, possible_types, False)
+
+    return {
+        "checking_typing_list": payload_case(
+            utils.checking_typing_list, (int,), lambda n: list(range(n))
+        ),
+        "checking_typing_set": payload_case(
+            utils.checking_typing_set, (int,), lambda n: set(range(n))
+        ),
+        "checking_typing_dict": payload_case(
+            utils.checking_typing_dict, (int, int), lambda n: dict.fromkeys(range(n), 0)
+        ),
+        "checking_typing_tuple": fixed_tuple,
+        "checking_ellipsis": payload_case(
+            utils.checking_ellipsis, (int, Ellipsis), lambda n: tuple(range(n))
+        ),
+        "checking_typing_iterable": payload_case(
+            utils.checking_typing_iterable, (int,), lambda n: list(range(n))
+        ),
+        "checking_typing_itervalidator": payload_case(
+            utils.checking_typing_itervalidator, (List[int], is_positive), lambda n: list(range(n))
+        ),
+        "checking_typing_json": payload_case(
+            utils.checking_typing_json, json, lambda n: list(range(n))
+        ),
+        "checking_typing_typedict_values": typedict_values,
+    }
+
+
+def unsized_cases() -> dict:
+    """
+    :return: the checking functions which only depend on the type of the argument
+    """
+    generator = (index for index in range(1))
+    cases = {
+        "checking_typing_type": lambda: utils.checking_typing_type(bool, (int,), False),
+        "checking_typing_union": lambda: utils.checking_typing_union(1, (int, str), False),
+        "checking_typing_iterator": lambda: utils.checking_typing_iterator(iter(())),
+        "checking_typing_callable": lambda: utils.checking_typing_callable(spell, (int, str)),
+        "checking_typing_generator": lambda: utils.checking_typing_generator(generator, None),
+        "checking_typing_literal": lambda: utils.checking_typing_literal("a", ("a", "b")),
+        "checking_typing_validator": lambda: utils.checking_typing_validator(
+            [1], (list, is_not_empty)
+        ),
+        "checking_typing_class": lambda: utils.checking_typing_class(1, int),
+    }
+    try:
+        from typing import TypedDict
+    except ImportError:
+        pass
+    else:
+
+        class Spell(TypedDict):
+            name: str
+            mana: int
+
+        cases["checking_typing_typeddict"] = lambda: utils.checking_typing_typeddict(
+            {"name": "Lumos", "mana": 5}, Spell
+        )
+    return cases
+
+
+def module_cases() -> dict:
+    """
+    :return: the functions of the strongtyping_modules extension and the annotation they check
+    """
+    return {
+        "module_checking_typing_list": (List[int], lambda n: list(range(n))),
+        "module_checking_typing_set": (Set[int], lambda n: set(range(n))),
+        "module_checking_typing_dict": (Dict[int, int], lambda n: dict.fromkeys(range(n), 0)),
+        "module_checking_typing_tuple": (Tuple[int, ...], lambda n: tuple(range(n))),
+        "module_checking_typing_validator": (
+            Validator[list, is_not_empty],
+            lambda n: list(range(n)),
+        ),
+    }
+
+
+def scalar_signature(a: int, b: str):
+    return a
+
+
+def signature_cases() -> dict:
+    """
+    :return: for every signature the call without a cache and the decorated calls,
+        whose checkers are plain isinstance checks, the default must not be slower
+    """
+    uncached_func = match_typing(cache_size=0)(scalar_signature)
+    typed_func = match_typing(scalar_signature)
+    codegen_func = match_typing(codegen=True)(scalar_signature)
+    return {
+        "scalar_signature": (
+            lambda: uncached_func(1, "a"),
+            {
+                "default": lambda: typed_func(1, "a"),
+                "codegen": lambda: codegen_func(1, "a"),
+            },
+        ),
+    }
+
+
+def slower_than_uncached(results: List[dict], threshold: float = 1.1) -> List[dict]:
+    """
+    :return: all signature benchmarks which are more than `threshold` times slower
+        than the same signature without a cache
+    """
+    return [
+        entry
+        for entry in results
+        if entry["group"] == GROUP and entry.get("uncached_ratio", 0) > threshold
+    ]
+
+
+def run(min_time: float = 0.2, repeat: int = 5, max_size: int = SIZES[-1], **kwargs) -> list:
+    sizes = [size for size in SIZES if size <= max_size]
+    results = []
+
+    with extension_disabled():
+        for name, create in sized_cases().items():
+            for size in sizes:
+                timings = measure(create(size), min_time, repeat)
+                results.append(result(GROUP, name, timings, size=size, extension=False))
+
+        for name, call in unsized_cases().items():
+            timings = measure(call, min_time, repeat)
+            results.append(result(GROUP, name, timings, size=None, extension=False))
+
+    if utils.extension_module:
+        for name, (annotation, payload_factory) in module_cases().items():
+            func = utils.supported_modules[name]
+            for size in sizes:
+                payload = payload_factory(size)
+                timings = measure(lambda: func(payload, annotation), min_time, repeat)
+                results.append(result(GROUP, name, timings, size=size, extension=True))
+
+    for name, (uncached, decorated) in signature_cases().items():
+        baseline = measure(uncached, min_time, repeat)
+        results.append(result(GROUP, name, baseline, variant="no_cache"))
+        for variant, call in decorated.items():
+            timings = measure(call, min_time, repeat)
+            uncached_ratio = timings["min"] / baseline["min"]
+            results.append(
+                result(GROUP, name, timings, variant=variant, uncached_ratio=uncached_ratio)
+            )
+    return results
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+from collections import namedtuple
+from typing import List
+
+from benchmarks.runner import measure, result
+from strongtyping.docstring_typing import match_docstring
+from strongtyping.strong_typing import match_class_typing, match_typing
+from strongtyping.type_namedtuple import typed_namedtuple
+from strongtyping.types import FrozenType
+
+GROUP = "decorators"
+VALUES = list(range(10))
+
+
+def func(a: int, b: List[int]):
+    return a
+
+
+def returning_func(a: int, b: List[int]) -> List[int]:
+    return b
+
+
+async def async_func(a: int, b: List[int]):
+    return a
+
+
+def run_coroutine(coroutine):
+    """
+    runs a coroutine which never suspends without an event loop
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+
+
+def docstring_func(a, b):
+    """
+    :param a:
+    :type a: int
+    :param b:
+    :type b: list(int)
+    """
+    return a
+
+
+class Spell:
+    def __init__(self, name: str, mana: int):
+        self.name = name
+        self.mana = mana
+
+    def cast(self, target: str, power: int):
+        return power
+
+
+class Wand:
+    def __init__(self):
+        pass
+
+    def cast(self, power: int):
+        return power
+
+
+class FrozenSpell:
+    mana = FrozenType(int)
+
+
+class PlainSpell:
+    mana = 0
+
+
+def overhead_cases() -> dict:
+    """
+    :return: for every benchmark the undecorated and the decorated call
+    """
+    typed_func = match_typing(func)
+    codegen_func = match_typing(codegen=True)(func)
+    uncached_func = match_typing(cache_size=0)(func)
+    lazy_func = match_typing(lazy=True)(func)
+    typed_docstring_func = match_docstring(docstring_func)
+    typed_returning_func = match_typing(returning_func)
+    return_checked_func = match_typing(check_return=True)(returning_func)
+    typed_async_func = match_typing(async_func)
+
+    typed_spell = match_class_typing(type("Spell", (Spell,), {}))
+    spell = Spell("Lumos", 1)
+    checked_spell = typed_spell("Lumos", 1)
+    # the methods of the class are wrapped once, an instance costs the call of the wrapped __init__
+    typed_wand = match_class_typing(cache_size=0)(type("Wand", (Wand,), {}))
+
+    plain_tuple = namedtuple("Dummy", ["spell", "mana", "effect"])
+    typed_tuple = typed_namedtuple("Dummy", ["spell:str", "mana:int", "effect:list"])
+
+    plain_spell = PlainSpell()
+    frozen_spell = FrozenSpell()
+
+    def assign_plain():
+        plain_spell.mana = 10
+
+    def assign_frozen():
+        frozen_spell.mana = 10
+
+    return {
+        "match_typing": (
+            lambda: func(1, VALUES),
+            {
+                "default": lambda: typed_func(1, VALUES),
+                "codegen": lambda: codegen_func(1, VALUES),
+                "no_cache": lambda: uncached_func(1, VALUES),
+                "lazy": lambda: lazy_func(1, VALUES),
+            },
+        ),
+        "match_typing.check_return": (
+            lambda: returning_func(1, VALUES),
+            {
+                "default": lambda: typed_returning_func(1, VALUES),
+                "check_return": lambda: return_checked_func(1, VALUES),
+            },
+        ),
+        "match_typing.async": (
+            lambda: run_coroutine(async_func(1, VALUES)),
+            {"default": lambda: run_coroutine(typed_async_func(1, VALUES))},
+        ),
+        "match_docstring": (
+            lambda: docstring_func(1, VALUES),
+            {"default": lambda: typed_docstring_func(1, VALUES)},
+        ),
+        "match_class_typing.method": (
+            lambda: spell.cast("Nox", 2),
+            {"default": lambda: checked_spell.cast("Nox", 2)},
+        ),
+        "match_class_typing.instantiation": (
+            lambda: Spell("Lumos", 1),
+            {"default": lambda: typed_spell("Lumos", 1)},
+        ),
+        "match_class_typing.instantiation_without_annotations": (
+            Wand,
+            {"default": typed_wand},
+        ),
+        "typed_namedtuple": (
+            lambda: plain_tuple("Lumos", 5, ["Makes light"]),
+            {"default": lambda: typed_tuple("Lumos", 5, ["Makes light"])},
+        ),
+        "FrozenType": (assign_plain, {"default": assign_frozen}),
+    }
+
+
+def run(min_time: float = 0.2, repeat: int = 5, **kwargs) -> list:
+    results = []
+    for name, (undecorated, decorated) in overhead_cases().items():
+        baseline = measure(undecorated, min_time, repeat)
+        results.append(result(GROUP, name, baseline, variant="undecorated"))
+        for variant, call in decorated.items():
+            timings = measure(call, min_time, repeat)
+            overhead = timings["min"] / baseline["min"]
+            results.append(result(GROUP, name, timings, variant=variant, overhead=overhead))
+    return results
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+from benchmarks.runner import result
+
+GROUP = "import"
+# the maximal import time in seconds, typing is imported by every application anyway
+# and is not part of the measured time
+BUDGETS = {
+    "strongtyping": 0.002,
+    "strongtyping.strong_typing": 0.015,
+}
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """
+    :param stderr: the output of `python -X importtime`
+    :return: the cumulative import time in microseconds of every module
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            # the header line
+            continue
+    return times
+
+
+def import_time(module: str, env: dict) -> float:
+    """
+    :return: the import time of `module` in seconds in a new interpreter
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import typing; import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)[module] / 1e6
+
+
+def measure_import(module: str, repeat: int, env: dict) -> dict:
+    # the first import writes the bytecode
+    import_time(module, env)
+    timings = [import_time(module, env) for _ in range(repeat)]
+    return {
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "loops": 1,
+        "runs": repeat,
+    }
+
+
+def run(repeat: int = 5, budgets: Optional[Dict[str, float]] = None, **kwargs) -> list:
+    budgets = BUDGETS if budgets is None else budgets
+    results = []
+    with tempfile.TemporaryDirectory() as pycache:
+        # without bytecode the compilation would be measured and not the import
+        env = {key: val for key, val in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+        env["PYTHONPYCACHEPREFIX"] = pycache
+        for module, budget in budgets.items():
+            timings = measure_import(module, repeat, env)
+            results.append(result(GROUP, module, timings, budget=budget))
+    return results
+
+
+def over_budget(results: List[dict]) -> List[dict]:
+    """
+    :return: all imports which took longer than their budget
+    """
+    return [
+        entry
+        for entry in results
+        if entry["group"] == GROUP and entry.get("budget") and entry["min"] > entry["budget"]
+    ]
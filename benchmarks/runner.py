@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import datetime
+import json
+import platform
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, Iterable, List, Optional
+
+from strongtyping.strong_typing_utils import extension_module
+
+
+def measure(func: Callable[[], object], min_time: float = 0.2, repeat: int = 5) -> dict:
+    """
+    :param func: will be called without arguments
+    :param min_time: minimal duration of a single run in seconds
+    :param repeat: number of runs
+    :return: the timings of a single call in seconds
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        duration = timer.timeit(number)
+        if duration >= min_time:
+            break
+        # aim directly for min_time instead of growing in small steps
+        number = max(number * 2, int(number * min_time / max(duration, 1e-9)))
+    timings = [run / number for run in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "loops": number,
+        "runs": repeat,
+    }
+
+
+def result(group: str, name: str, timings: dict, **info) -> dict:
+    return {"group": group, "name": name, **info, **timings}
+
+
+def benchmark_key(entry: dict) -> tuple:
+    """
+    :return: everything which identifies a benchmark, except the measured values
+    """
+    return (
+        entry["group"],
+        entry["name"],
+        entry.get("variant"),
+        entry.get("size"),
+        entry.get("extension"),
+    )
+
+
+def strongtyping_version() -> Optional[str]:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        return None
+    try:
+        return version("strongtyping")
+    except PackageNotFoundError:
+        return None
+
+
+def metadata() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "strongtyping": strongtyping_version(),
+        "extension_module": extension_module,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def write_json(results: List[dict], output: Optional[str]):
+    """
+    :param output: path of the json file, stdout if None
+    """
+    report = {"metadata": metadata(), "benchmarks": results}
+    if output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+def compare(baseline: dict, current: Iterable[dict], threshold: float) -> List[Dict]:
+    """
+    :param baseline: a report written by `write_json`
+    :param threshold: the allowed ratio between the current and the baseline timing
+    :return: all benchmarks which are slower than allowed
+    """
+    previous = {benchmark_key(entry): entry for entry in baseline["benchmarks"]}
+    regressions = []
+    for entry in current:
+        old = previous.get(benchmark_key(entry))
+        if old is None or not old["min"]:
+            continue
+        ratio = entry["min"] / old["min"]
+        if ratio > threshold:
+            regressions.append({**entry, "baseline": old["min"], "ratio": ratio})
+    return regressions
@@ -14,7 +14,7 @@ HERE = pathlib.Path(__file__).parent
 # The text of the README file
 README = (HERE / "README.md").read_text()
 
-packages = find_packages(exclude=["test_*", "*.tests"])
+packages = find_packages(exclude=["test_*", "*.tests", "benchmarks", "benchmarks.*"])
 
 setup(
     name="strongtyping",
@@ -6,3 +6,19 @@
 #   strong_typing
 #   strong_typing_utils
 #   type_namedtuple
+
+from strongtyping.docstring_typing import match_class_docstring as match_class_docstring
+from strongtyping.docstring_typing import match_docstring as match_docstring
+from strongtyping.numpy_typing import NDArray as NDArray
+from strongtyping.strong_typing import match_class_typing as match_class_typing
+from strongtyping.strong_typing import match_typing as match_typing
+from strongtyping.strong_typing_utils import TypeMisMatch as TypeMisMatch
+from strongtyping.strong_typing_utils import ValidationError as ValidationError
+from strongtyping.strong_typing_utils import check_type as check_type
+from strongtyping.strong_typing_utils import register_checker as register_checker
+from strongtyping.types import FrozenType as FrozenType
+from strongtyping.types import IterValidator as IterValidator
+from strongtyping.types import TypedList as TypedList
+from strongtyping.types import TypedMapping as TypedMapping
+from strongtyping.types import TypedSet as TypedSet
+from strongtyping.types import Validator as Validator
@@ -1,12 +1,12 @@
-from typing import Any
+from typing import Any, Callable, Optional, Union
 
 from strongtyping.config import SEVERITY_LEVEL as SEVERITY_LEVEL
 
-logger: Any
-
 def remove_subclass(args: Any, subclass: Any): ...
+def _is_stripped(severity_: Union[str, SEVERITY_LEVEL] = ...) -> bool: ...
+def _lazy_enabled(lazy: Union[str, bool, None] = ...) -> bool: ...
+def call_sampler(sample_rate: Union[str, float, None] = ...) -> Optional[Callable[[], bool]]: ...
 
-SEVERITY_CONFIG: Any
 exclude_builtins: Any
 
 def install_st_m() -> None: ...
@@ -1,8 +1,33 @@
-from typing import Any, Union
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional, Union
 
-class CachedDict(dict):
+def get_size(obj: Any, seen: Optional[set] = ...) -> int: ...
+
+class CachedDict(MutableMapping):
     memory_limit: Any = ...
+    max_items: Optional[int] = ...
+    ttl: Optional[float] = ...
+    accurate_size: bool = ...
+    items_size: int = ...
     def __init__(
-        self, memory_limit: Union[int, float] = ..., *args: Any, **kwargs: Any
+        self,
+        memory_limit: Union[int, float] = ...,
+        *args: Any,
+        max_items: Optional[int] = ...,
+        ttl: Optional[float] = ...,
+        accurate_size: bool = ...,
+        **kwargs: Any,
     ) -> None: ...
-    def __setitem__(self, key: Any, value: Any) -> Any: ...
+    @property
+    def memory_usage(self) -> int: ...
+    def is_expired(self, key: Any) -> bool: ...
+    def move_to_end(self, key: Any, last: bool = ...) -> None: ...
+    def touch(self, key: Any) -> bool: ...
+    def __setitem__(self, key: Any, value: Any) -> None: ...
+    def __getitem__(self, key: Any) -> Any: ...
+    def __delitem__(self, key: Any) -> None: ...
+    def __iter__(self) -> Iterator: ...
+    def __len__(self) -> int: ...
+    def items(self) -> list: ...
+    def values(self) -> list: ...
+    def popitem(self, last: bool = ...) -> tuple: ...
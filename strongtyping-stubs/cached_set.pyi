@@ -1,8 +1,21 @@
-from typing import Any, Union
+from collections.abc import MutableSet
+from typing import Any, Iterator, Optional, Union
 
-class CachedSet(set):
-    memory_limit: Any = ...
+class CachedSet(MutableSet):
     def __init__(
-        self, memory_limit: Union[int, float] = ..., *args: Any, **kwargs: Any
+        self,
+        memory_limit: Union[int, float] = ...,
+        *args: Any,
+        max_items: Optional[int] = ...,
+        ttl: Optional[float] = ...,
+        accurate_size: bool = ...,
     ) -> None: ...
+    @property
+    def memory_limit(self) -> float: ...
+    @property
+    def memory_usage(self) -> int: ...
     def add(self, element: Any) -> None: ...
+    def discard(self, element: Any) -> None: ...
+    def __contains__(self, element: Any) -> bool: ...
+    def __iter__(self) -> Iterator: ...
+    def __len__(self) -> int: ...
@@ -0,0 +1,118 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+def is_generator(arg: Any) -> bool: ...
+def add_to_namespace(namespace: dict, obj: Any, prefix: str = ...) -> str: ...
+def element_selector(
+    container_check: str = ..., sample_size: int = ..., **kwargs: Any
+) -> Optional[Callable]: ...
+
+class Checker:
+    annotation: Any
+    checks: int
+    failures: int
+    def __init__(self, annotation: Any) -> None: ...
+    def __call__(self, arg: Any) -> bool: ...
+    @property
+    def type_determined(self) -> bool: ...
+    def fast_source(self, var: str, namespace: dict, depth: int = ...) -> Optional[str]: ...
+    def source(self, var: str, namespace: dict, depth: int = ...) -> str: ...
+
+class PassChecker(Checker): ...
+class ValidationChecker(Checker): ...
+
+class InstanceChecker(Checker):
+    @property
+    def plain_type(self) -> Any: ...
+
+class ClassNameChecker(Checker): ...
+class DuckTypingChecker(Checker): ...
+class JsonChecker(Checker): ...
+class ModuleChecker(Checker): ...
+
+class ContainerChecker(Checker):
+    def check_items(self, items: Any) -> bool: ...
+
+class ListChecker(ContainerChecker): ...
+class SetChecker(ContainerChecker): ...
+class DictChecker(Checker): ...
+class TupleChecker(Checker): ...
+class EllipsisTupleChecker(ContainerChecker): ...
+class UnionChecker(Checker): ...
+class IterableChecker(Checker): ...
+class NDArrayChecker(Checker): ...
+
+class RegisteredChecker(Checker):
+    checker: Callable[[Any, Any], bool]
+    def __init__(self, annotation: Any, checker: Callable[[Any, Any], bool]) -> None: ...
+
+class FallbackChecker(Checker): ...
+
+PASS_CHECKER: PassChecker
+NOT_CACHEABLE: Any
+IMMUTABLE_SCALARS: Tuple[type, ...]
+IMMUTABLE_CONTAINERS: Tuple[type, ...]
+MAX_CACHED_LENGTH: int
+
+class Identity:
+    obj: Any
+    def __init__(self, obj: Any) -> None: ...
+
+def argument_fingerprint(arg: Any, type_determined: bool, identity: bool = ...) -> Any: ...
+def compile_checker(type_of: Any, check_duck_typing: bool = ..., **kwargs: Any) -> Checker: ...
+def checker_cache_info() -> dict: ...
+def checker_stats() -> List[dict]: ...
+def reset_checker_stats() -> None: ...
+def clear_checker_cache() -> None: ...
+
+ITERATOR_ORIGINS: Tuple[type, ...]
+ASYNC_ITERATOR_ORIGINS: Tuple[type, ...]
+
+def iterator_item_type(type_of: Any, origins: tuple = ...) -> Any: ...
+
+class IteratorProxy:
+    iterator: Any
+    item: Checker
+    name: str
+    on_failure: Callable[[str, Any], None]
+    def __init__(
+        self, iterator: Any, item: Checker, name: str, on_failure: Callable[[str, Any], None]
+    ) -> None: ...
+    def checked(self, value: Any) -> Any: ...
+    def __iter__(self) -> IteratorProxy: ...
+    def __next__(self) -> Any: ...
+    def send(self, value: Any) -> Any: ...
+    def throw(self, *args: Any) -> Any: ...
+    def close(self) -> None: ...
+    def __getattr__(self, item: str) -> Any: ...
+
+class CheckerPlan:
+    arg_names: Tuple[str, ...]
+    checkers: Dict[str, Checker]
+    positional: Tuple[Tuple[int, str, Checker], ...]
+    iterators: Tuple[Tuple[int, str, Checker], ...]
+    returns: Optional[Checker]
+    def __init__(
+        self,
+        arg_names: Any,
+        annotations: dict,
+        wrap_iterators: bool = ...,
+        check_return: bool = ...,
+        **kwargs: Any,
+    ) -> None: ...
+    type_determined: Tuple[bool, ...]
+    worth_caching: bool
+    def failed_params(self, args: tuple, kwargs: dict) -> tuple: ...
+    def count_checks(self, args: tuple, kwargs: dict, failed_params: tuple) -> None: ...
+    def wrap_iterators(
+        self, args: tuple, kwargs: dict, on_failure: Callable[[str, Any], None]
+    ) -> Tuple[tuple, dict]: ...
+    def fingerprint(self, args: tuple, kwargs: dict, identity: bool = ...) -> Optional[tuple]: ...
+    @property
+    def return_worth_caching(self) -> bool: ...
+    def return_fingerprint(self, result: Any, identity: bool = ...) -> Optional[tuple]: ...
+
+class CodegenCheckerPlan(CheckerPlan):
+    source: str
+    def __init__(
+        self, arg_names: Any, annotations: dict, func_name: str = ..., **kwargs: Any
+    ) -> None: ...
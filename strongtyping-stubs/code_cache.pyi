@@ -0,0 +1,11 @@
+from types import CodeType
+from typing import Optional
+
+CACHE_VERSION: int
+CACHE_TAG: str
+
+def cache_dir() -> Optional[str]: ...
+def cache_path(directory: str, source: str, filename: str) -> str: ...
+def load_code(path: str) -> Optional[CodeType]: ...
+def write_code(path: str, code: CodeType) -> None: ...
+def compile_cached(source: str, filename: str) -> CodeType: ...
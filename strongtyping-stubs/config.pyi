@@ -1,11 +1,29 @@
 from enum import Enum
-from typing import Any
+from typing import Any, Dict
 
 class SEVERITY_LEVEL(Enum):
+    STRIP: int = ...
     DISABLED: int = ...
     ENABLED: int = ...
     WARNING: int = ...
     @property
     def value_as_str(self): ...
 
+SEVERITY_CONFIG: Dict[str, SEVERITY_LEVEL]
+
+class Settings:
+    severity: int
+    def __init__(self) -> None: ...
+    def refresh(self) -> int: ...
+
+settings: Settings
+
+class FixedSeverity:
+    severity: int
+    def __init__(self, severity: int) -> None: ...
+
 def set_severity_level(_level: SEVERITY_LEVEL) -> Any: ...
+def set_sample_rate(sample_rate: float) -> None: ...
+def set_stats(enabled: bool) -> None: ...
+def set_lazy(enabled: bool) -> None: ...
+def set_cache_dir(path: str) -> None: ...
@@ -1,5 +1,5 @@
 import typing
-from typing import Any
+from typing import Any, Callable, Optional
 
 from strongtyping._utils import action as action, remove_subclass as remove_subclass
 from strongtyping.cached_set import CachedSet as CachedSet
@@ -30,6 +30,9 @@ def is_function_or_method_type(arg: Any, type_of: Any): ...
 
 options: Any
 
+def accept_all(arg: Any) -> bool: ...
+def compile_container_type(container: type, type_of: str) -> Callable[[Any], bool]: ...
+def compile_doc_str_type(type_of: Optional[str]) -> Callable[[Any], bool]: ...
 def check_doc_str_type(arg: Any, type_of: Any): ...
 def is_type_info(docstring_line: str) -> bool: ...
 def is_param_info(docstring_line: str) -> bool: ...
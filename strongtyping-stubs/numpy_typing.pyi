@@ -0,0 +1,21 @@
+from typing import Any, Dict, Optional, Tuple
+
+BUILTIN_KINDS: Dict[type, str]
+
+def is_ndarray(arg: Any) -> bool: ...
+def dtype_matches(dtype: Any, item_type: Any) -> bool: ...
+def ndarray_items_match(arg: Any, item_type: Any) -> Optional[bool]: ...
+
+class NDArrayType:
+    dtype: Any
+    shape: Optional[Tuple[Optional[int], ...]]
+    kinds: Optional[str]
+    def __init__(
+        self, dtype: Any = ..., shape: Optional[Tuple[Optional[int], ...]] = ...
+    ) -> None: ...
+    def __getitem__(self, parameters: Any) -> NDArrayType: ...
+    def dtype_matches(self, dtype: Any) -> bool: ...
+    def shape_matches(self, shape: tuple) -> bool: ...
+    def __instancecheck__(self, instance: Any) -> bool: ...
+
+NDArray: NDArrayType
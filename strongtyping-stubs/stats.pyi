@@ -0,0 +1,33 @@
+from collections import Counter, deque
+from typing import Any, Callable, Dict, Optional, Union
+
+MAX_CHECK_TIMES: int
+PERCENTILES: tuple
+
+def stats_enabled(stats: Union[str, bool, None] = ...) -> bool: ...
+
+class FunctionStats:
+    name: str
+    calls: int
+    checked_calls: int
+    cache_hits: int
+    cache_misses: int
+    check_time: float
+    check_times: deque
+    failures: Counter
+    def __init__(self, name: str) -> None: ...
+    def reset(self) -> None: ...
+    def count_calls(self, func: Callable) -> Callable: ...
+    def count_cache_hits(self, is_cached: Callable) -> Callable: ...
+    def time_checks(
+        self, check_arguments: Callable, count_checks: Optional[Callable] = ...
+    ) -> Callable: ...
+    def percentile(self, percent: float) -> Optional[float]: ...
+    def as_dict(self) -> dict: ...
+
+def register(func: Callable) -> FunctionStats: ...
+def get_stats(
+    name: Optional[str] = ...,
+) -> Union[FunctionStats, Dict[str, FunctionStats], None]: ...
+def dump_stats(path: Optional[str] = ...) -> Dict[str, Any]: ...
+def reset_stats() -> None: ...
@@ -1,21 +1,26 @@
-from typing import Any, Optional, Type
+from typing import Any, Callable, Optional, Type
 
 from strongtyping._utils import action as action, remove_subclass as remove_subclass
 from strongtyping.cached_set import CachedSet as CachedSet
 from strongtyping.strong_typing_utils import (
+    DefaultReturn as DefaultReturn,
     TypeMisMatch as TypeMisMatch,
     check_type as check_type,
     checking_typing_typedict_values as checking_typing_typedict_values,
-    default_return_queue as default_return_queue,
     get_origins as get_origins,
     py_version as py_version,
 )
 
+def coroutine_wrapper(func: Callable, inner: Callable) -> Callable: ...
+def async_generator_wrapper(
+    func: Callable, inner: Callable, check_item: Optional[Callable[[Any], None]] = ...
+) -> Callable: ...
+def lazy_wrapper(func: Callable, decorate: Callable[[Callable], Callable]) -> Callable: ...
 def match_typing(
     _func: Any = ...,
     *,
     excep_raise: Type[Exception] = ...,
-    subclass: bool = ...,
+    subclass: Optional[bool] = ...,
     severity: Any = ...,
     **kwargs: Any,
 ) -> Any: ...
@@ -1,11 +1,10 @@
 import typing
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 
 from strongtyping._utils import install_st_m as install_st_m
 
 extension_module: bool
 empty: Any
-default_return_queue: Any
 
 class TypeMisMatch(AttributeError):
     def __init__(self, message: Any) -> None: ...
@@ -13,13 +12,34 @@ class TypeMisMatch(AttributeError):
 class ValidationError(Exception):
     def __init__(self, message: Any) -> None: ...
 
+class DefaultReturn(Exception):
+    value: Any
+    def __init__(self, value: Any) -> None: ...
+
+BUFFER_ITEM_TYPES: Dict[str, type]
+
+def buffer_item_type(arg: Any) -> Optional[type]: ...
+def items_match_by_type(arg: Any, item_type: Any) -> Optional[bool]: ...
+def is_known_valid(arg: Any, possible_types: tuple) -> bool: ...
+
+registered_checkers: Dict[Any, Callable[[Any, Any], bool]]
+
+def register_checker(
+    origin: Any, checker: Optional[Callable[[Any, Any], bool]] = ...
+) -> Callable: ...
+def unregister_checker(origin: Any) -> None: ...
+def get_registered_checker(type_of: Any) -> Optional[Callable[[Any, Any], bool]]: ...
+
 py_version: Any
 typing_base_class: Any
 typing_base_class = typing.GenericMeta
 
 def get_possible_types(typ_to_check: Any) -> typing.Union[tuple, None]: ...
 def get_origins(typ_to_check: Any) -> tuple: ...
-def checking_typing_dict(arg: Any, possible_types: tuple, *args: Any) -> Any: ...
+def get_elements(
+    arg: Any, container_check: str = ..., sample_size: int = ..., **kwargs: Any
+) -> Any: ...
+def checking_typing_dict(arg: Any, possible_types: tuple, *args: Any, **kwargs: Any) -> Any: ...
 def checking_typing_set(arg: Any, possible_types: tuple, *args: Any, **kwargs: Any) -> Any: ...
 def checking_typing_type(arg: Any, possible_types: tuple, *args: Any, **kwargs: Any) -> Any: ...
 def checking_typing_union(arg: Any, possible_types: tuple, mro: Any, **kwargs: Any) -> Any: ...
@@ -1,4 +1,4 @@
-from typing import Any, Type
+from typing import Any, Dict, List, Set, Type, TypeVar
 
 from strongtyping.strong_typing_utils import py_version as py_version
 
@@ -11,3 +11,19 @@ class FrozenType:
     @classmethod
     def cast(cls, instance: Any, origin: Any, new: Type):
         pass
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+class TypedContainer:
+    parameters: int
+    item_types: tuple
+    item_checkers: tuple
+    known_valid: bool
+    def __class_getitem__(cls, item_types: Any) -> Type[Any]: ...
+    def check_item(self, item: T, index: int = 0) -> T: ...
+
+class TypedList(TypedContainer, List[T]): ...
+class TypedMapping(TypedContainer, Dict[K, V]): ...
+class TypedSet(TypedContainer, Set[T]): ...
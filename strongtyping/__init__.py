@@ -4,13 +4,52 @@
 @created: 04.06.20
 @author: felix
 """
+from importlib import import_module
 
 __all__ = [
     "_utils",
     "strong_typing_utils",
     "strong_typing",
+    "checker_plan",
+    "code_cache",
+    "stats",
     "docstring_typing",
+    "numpy_typing",
     "cached_set",
     "cached_dict",
     "type_namedtuple",
 ]
+
+# these names are imported from their module with the first access, `import strongtyping` stays cheap
+_lazy_attributes = {
+    "match_typing": "strong_typing",
+    "match_class_typing": "strong_typing",
+    "TypeMisMatch": "strong_typing_utils",
+    "ValidationError": "strong_typing_utils",
+    "check_type": "strong_typing_utils",
+    "register_checker": "strong_typing_utils",
+    "match_docstring": "docstring_typing",
+    "match_class_docstring": "docstring_typing",
+    "NDArray": "numpy_typing",
+    "Validator": "types",
+    "IterValidator": "types",
+    "FrozenType": "types",
+    "TypedList": "types",
+    "TypedMapping": "types",
+    "TypedSet": "types",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_attributes:
+        value = getattr(import_module(f"{__name__}.{_lazy_attributes[name]}"), name)
+    elif name in __all__:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__, *_lazy_attributes})
@@ -4,14 +4,12 @@
 @created: 20.07.20
 @author: felix
 """
-import logging
 import os
-from types import MethodType
-from typing import Type, Union
+from itertools import count
+from types import FunctionType
+from typing import Callable, Optional, Type, Union
 
-from strongtyping.config import SEVERITY_LEVEL
-
-logger = logging.getLogger(__name__)
+from strongtyping.config import SEVERITY_LEVEL, settings
 
 ORIGINAL_DUCK_TYPES = {
     int: [int, float, complex],
@@ -29,75 +27,114 @@ def remove_subclass(args, subclass):
     return args
 
 
-SEVERITY_CONFIG = {
-    "warning": SEVERITY_LEVEL.WARNING,
-    "disable": SEVERITY_LEVEL.DISABLED,
-    "enable": SEVERITY_LEVEL.ENABLED,
-}
-
-
 def _severity_level(severity_: Union[str, SEVERITY_LEVEL]):
     if severity_ == "env":
-        _level = os.environ.get("ST_SEVERITY", "1")
-        try:
-            return int(_level)
-        except (TypeError, ValueError):
-            return SEVERITY_CONFIG[_level].value
+        return settings.severity
     else:
         return severity_.value  # type: ignore
 
 
+def _is_stripped(severity_: Union[str, SEVERITY_LEVEL] = "env") -> bool:
+    """
+    :return: True if the decorators should return the undecorated object
+    """
+    return _severity_level(severity_) == SEVERITY_LEVEL.STRIP.value
+
+
+def _lazy_enabled(lazy: Union[str, bool, None] = "env") -> bool:
+    """
+    :return: True if the checks should be compiled with the first call instead of the decoration
+    """
+    if lazy is None or lazy == "env":
+        return os.environ.get("ST_LAZY", "0").lower() in ("1", "true", "enable")
+    return bool(lazy)
+
+
+def _sample_rate(sample_rate: Union[str, float, None]) -> float:
+    """
+    :return: the share of calls which will be checked between 0.0 and 1.0
+    """
+    if sample_rate is None or sample_rate == "env":
+        sample_rate = os.environ.get("ST_SAMPLE_RATE", "1")
+    sample_rate = float(sample_rate)
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError("sample_rate must be between 0.0 and 1.0")
+    return sample_rate
+
+
+def call_sampler(sample_rate: Union[str, float, None] = "env") -> Optional[Callable[[], bool]]:
+    """
+    :return: a function which returns True for the calls which should be checked
+        or None if every call should be checked
+    """
+    sample_rate = _sample_rate(sample_rate)
+    if sample_rate == 1.0:
+        return None
+    # `next` of itertools.count is atomic, so no lock is needed when called from many threads
+    calls = count()
+
+    def is_sampled() -> bool:
+        # spreads the checked calls evenly, e.g. every 4th call for 0.25
+        call = next(calls)
+        return int((call + 1) * sample_rate) != int(call * sample_rate)
+
+    return is_sampled
+
+
 exclude_builtins = dir(object)
 
 
+def _wrap_methods(cls_, typing_func, **typing_kwargs):
+    """
+    replaces all methods with type annotations of `cls_` with the wrapped ones, so that
+    the wrapping happens once per class and not for every new instance
+    """
+    from inspect import getattr_static
+
+    for attr in dir(cls_):
+        if attr in exclude_builtins:
+            continue
+        cls_attr = getattr_static(cls_, attr)
+        is_descriptor = isinstance(cls_attr, (staticmethod, classmethod))
+        func = cls_attr.__func__ if is_descriptor else cls_attr
+        if not isinstance(func, FunctionType) or hasattr(func, "__fe_strng_mtch__"):
+            continue
+        if not any(name != "return" for name in func.__annotations__):
+            continue
+        wrapped = typing_func(func, **typing_kwargs)
+        setattr(cls_, attr, type(cls_attr)(wrapped) if is_descriptor else wrapped)
+
+
 def _get_new(
     typing_func, excep_raise: Type[Exception] = TypeError, cache_size=0, severity="env", **kwargs
 ):
-    def new_with_match_typing(cls_, *args, **kwargs):
-        def add_match_typing(obj: object, attr: str) -> bool:
-            if (
-                hasattr(getattr(cls_, attr), "__annotations__")
-                and getattr(cls_, attr).__class__.__name__ != "property"
-                and not hasattr(getattr(x, attr), "__fe_strng_mtch__")
-            ):
-                type_annotations = getattr(getattr(cls_, attr), "__annotations__")
-                return len([i for i in type_annotations.keys() if i != "return"]) > 0
-            return False
-
-        x = object.__new__(cls_)
-        [
-            setattr(
-                x,
-                cls_func,
-                MethodType(
-                    typing_func(
-                        getattr(x, cls_func),
-                        excep_raise=excep_raise,
-                        cache_size=cache_size,
-                        subclass=True,
-                        severity=severity,
-                    ),
-                    x,
-                ),
+    def new_with_match_typing(cls_, *args, **cls_kwargs):
+        # subclasses inherit this __new__ but can have their own methods
+        if not cls_.__dict__.get("__fe_strng_cls__", False):
+            _wrap_methods(
+                cls_,
+                typing_func,
+                excep_raise=excep_raise,
+                cache_size=cache_size,
+                severity=severity,
+                **kwargs,
             )
-            for cls_func in dir(x)
-            if cls_func not in exclude_builtins and add_match_typing(x, cls_func)
-        ]
-        return x
+            cls_.__fe_strng_cls__ = True
+        return object.__new__(cls_)
 
     return new_with_match_typing
 
 
 def install_st_m():
-    import os
-
     try:
         from strongtyping_modules.install import install  # type: ignore
     except ImportError:
         os.environ["ST_MODULES_INSTALLED"] = "0"
     else:
         if not bool(int(os.environ.get("ST_MODULES_INSTALLED", "0"))):
-            logger.info("strongtyping_modules will be installed")
+            import logging
+
+            logging.getLogger(__name__).info("strongtyping_modules will be installed")
             install()
             os.environ["ST_MODULES_INSTALLED"] = "1"
 
@@ -5,22 +5,178 @@
 @author: felix
 """
 import sys
-from typing import Any, Union
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional, Union
 
 
-class CachedDict(dict):
+def get_size(obj: Any, seen: Optional[set] = None) -> int:
     """
-    Warning only use for caching when Memory limit is reached all items will be cleared
+    :return: the size of `obj` in bytes including the elements of builtin containers
     """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or isinstance(obj, type):
+        # classes are shared and not owned by the container
+        return 0
+    seen.add(id(obj))
 
-    def __init__(self, memory_limit: Union[int, float] = 1, *args, **kwargs):
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(get_size(key, seen) + get_size(val, seen) for key, val in obj.items())
+    elif isinstance(obj, (tuple, list, set, frozenset)):
+        size += sum(get_size(element, seen) for element in obj)
+    return size
+
+
+class CachedDict(MutableMapping):
+    """
+    When the memory limit is reached the least recently used items will be removed
+    """
+
+    def __init__(
+        self,
+        memory_limit: Union[int, float] = 1,
+        *args,
+        max_items: Optional[int] = None,
+        ttl: Optional[float] = None,
+        accurate_size: bool = False,
+        **kwargs,
+    ):
         """
         :param memory_limit: in MB
+        :param max_items: the maximum number of items, no limit if None
+        :param ttl: seconds after which an item expires, never if None
+        :param accurate_size: include the size of all keys and values in the memory limit
+            instead of only the size of the dict itself
         """
         self.memory_limit = memory_limit * 1000000
-        super().__init__(*args, **kwargs)
+        self.max_items = max_items
+        self.ttl = ttl
+        self.accurate_size = accurate_size
+        self.items_size = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._expires = {}
+        # the decorated functions share their cache between all threads,
+        # threading is imported with the first cache like the lock of lazy decoration
+        import threading
+
+        self._lock = threading.RLock()
+        self.update(*args, **kwargs)
+
+    @property
+    def memory_usage(self) -> int:
+        if self.accurate_size:
+            return sys.getsizeof(self._data) + self.items_size
+        return sys.getsizeof(self._data)
+
+    def is_expired(self, key: Any) -> bool:
+        return self.ttl is not None and self._expires[key] < time.monotonic()
+
+    def _forget(self, key: Any):
+        self.items_size -= self._sizes.pop(key, 0)
+        self._expires.pop(key, None)
+
+    def _evict(self):
+        data = self._data
+        while len(data) > 1:
+            if (
+                self.memory_usage > self.memory_limit
+                or (self.max_items is not None and len(data) > self.max_items)
+                or (self.ttl is not None and self.is_expired(next(iter(data))))
+            ):
+                self.popitem(last=False)
+            else:
+                break
+
+    def move_to_end(self, key: Any, last: bool = True):
+        with self._lock:
+            self._data.move_to_end(key, last)
+
+    def touch(self, key: Any) -> bool:
+        """
+        :return: True if key is cached, it becomes the most recently used one
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return False
+            if self.is_expired(key):
+                del self[key]
+                return False
+            return True
 
     def __setitem__(self, key: Any, value: Any):
-        if sys.getsizeof(self) > self.memory_limit:
-            self.clear()
-        super().__setitem__(key, value)
+        size = get_size(key) + get_size(value) if self.accurate_size else 0
+        with self._lock:
+            if key in self._data:
+                self._forget(key)
+                self._data.move_to_end(key)
+            self._data[key] = value
+            if self.accurate_size:
+                self._sizes[key] = size
+                self.items_size += size
+            if self.ttl is not None:
+                self._expires[key] = time.monotonic() + self.ttl
+            self._evict()
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            value = self._data[key]
+            if self.is_expired(key):
+                del self[key]
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            if key not in self._data:
+                return False
+            if self.is_expired(key):
+                del self[key]
+                return False
+            return True
+
+    def __delitem__(self, key: Any):
+        with self._lock:
+            del self._data[key]
+            self._forget(key)
+
+    def pop(self, key: Any, *default) -> Any:
+        with self._lock:
+            return super().pop(key, *default)
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def items(self) -> list:
+        with self._lock:
+            return list(self._data.items())
+
+    def values(self) -> list:
+        with self._lock:
+            return list(self._data.values())
+
+    def popitem(self, last: bool = True) -> tuple:
+        with self._lock:
+            key, value = self._data.popitem(last)
+            self._forget(key)
+            return key, value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._expires.clear()
+            self.items_size = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self._data)})"
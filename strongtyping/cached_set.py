@@ -4,23 +4,68 @@
 @created: 07.06.20
 @author: felix
 """
-import sys
-from typing import Any, Union
+from collections.abc import MutableSet
+from typing import Any, Iterator, Optional, Union
 
+from strongtyping.cached_dict import CachedDict
 
-class CachedSet(set):
+
+class CachedSet(MutableSet):
     """
-    Warning only use for caching when Memory limit is reached all items will be cleared
+    When the memory limit is reached the least recently used elements will be removed
     """
 
-    def __init__(self, memory_limit: Union[int, float] = 1, *args, **kwargs):
+    def __init__(
+        self,
+        memory_limit: Union[int, float] = 1,
+        *args,
+        max_items: Optional[int] = None,
+        ttl: Optional[float] = None,
+        accurate_size: bool = False,
+    ):
         """
         :param memory_limit: in MB
+        :param max_items: the maximum number of elements, no limit if None
+        :param ttl: seconds after which an element expires, never if None
+        :param accurate_size: include the size of all elements in the memory limit
         """
-        self.memory_limit = memory_limit * 1000000
-        super(CachedSet, self).__init__(*args, **kwargs)
+        self._elements = CachedDict(
+            memory_limit, max_items=max_items, ttl=ttl, accurate_size=accurate_size
+        )
+        for element in set(*args):
+            self.add(element)
+
+    @classmethod
+    def _from_iterable(cls, iterable) -> set:
+        # results of set operations like `|` or `&` are regular sets
+        return set(iterable)
+
+    @property
+    def memory_limit(self) -> float:
+        return self._elements.memory_limit
+
+    @property
+    def memory_usage(self) -> int:
+        return self._elements.memory_usage
 
     def add(self, element: Any) -> None:
-        if sys.getsizeof(self) > self.memory_limit:
-            self.clear()
-        super().add(element)
+        self._elements[element] = None
+
+    def discard(self, element: Any) -> None:
+        self._elements.pop(element, None)
+
+    def clear(self) -> None:
+        self._elements.clear()
+
+    def __contains__(self, element: Any) -> bool:
+        # a lookup is a cache hit, so the element becomes the most recently used one
+        return self._elements.touch(element)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._elements)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({set(self._elements)})"
@@ -0,0 +1,948 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import collections.abc
+import re
+import typing
+from functools import partial
+from itertools import repeat
+from typing import Any, Callable, Dict, List
+
+from strongtyping.cached_dict import get_size
+from strongtyping.code_cache import compile_cached
+from strongtyping.numpy_typing import NDArrayType
+from strongtyping.strong_typing_utils import (
+    check_duck_typing,
+    check_type,
+    checking_typing_generator,
+    checking_typing_iterator,
+    checking_typing_json,
+    get_elements,
+    get_origins,
+    get_possible_types,
+    get_registered_checker,
+    is_known_valid,
+    items_match_by_type,
+    py_version,
+    supported_modules,
+    typing_base_class,
+    validate_object,
+)
+
+
+def is_generator(arg: Any) -> bool:
+    return checking_typing_generator(arg, None)
+
+
+def add_to_namespace(namespace: dict, obj: Any, prefix: str = "c") -> str:
+    """
+    :return: the name under which the generated source can access `obj`
+    """
+    name = f"_{prefix}{len(namespace)}"
+    namespace[name] = obj
+    return name
+
+
+def all_items_source(item, items: str, namespace: dict, depth: int) -> str:
+    """
+    :return: an expression which checks all elements of `items` with the checker `item`
+    """
+    item_type = getattr(item, "plain_type", None)
+    if item_type is not None:
+        item_type_name = add_to_namespace(namespace, item_type, "t")
+        return f"all(map(isinstance, {items}, repeat({item_type_name})))"
+    element = f"_e{depth}"
+    return f"all({item.source(element, namespace, depth + 1)} for {element} in {items})"
+
+
+def element_selector(container_check: str = None, sample_size: int = None, **kwargs):
+    """
+    :return: a function which returns the elements of a container that needs to be checked
+        or None if all elements will be checked
+    """
+    if container_check is None or container_check == "full":
+        return None
+    return partial(get_elements, container_check=container_check, sample_size=sample_size)
+
+
+class Checker:
+    """
+    A checker is compiled once for an annotation and afterwards only called with the argument.
+
+    Calling it returns a truthy value if the argument matches the annotation.
+    The functions decorated with `stats=True` count how often it checked and failed.
+    """
+
+    __slots__ = ("annotation", "checks", "failures")
+
+    def __init__(self, annotation):
+        self.annotation = annotation
+        self.checks = 0
+        self.failures = 0
+
+    def __call__(self, arg: Any) -> bool:
+        raise NotImplementedError
+
+    @property
+    def type_determined(self) -> bool:
+        """
+        True if the result only depends on the type of the argument
+        """
+        return False
+
+    def fast_source(self, var: str, namespace: dict, depth: int = 0) -> typing.Optional[str]:
+        """
+        :return: an expression which is only true if `var` matches without calling the checker,
+            a false result is decided by the checker itself. None if there is no such expression
+        """
+        return None
+
+    def source(self, var: str, namespace: dict, depth: int = 0) -> str:
+        """
+        :return: an expression which checks `var`, used by the CodegenCheckerPlan
+        """
+        full_check = f"{add_to_namespace(namespace, self)}({var})"
+        fast_check = self.fast_source(var, namespace, depth)
+        if fast_check is None:
+            return full_check
+        return f"({fast_check} or {full_check})"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.annotation})"
+
+
+class PassChecker(Checker):
+    """
+    for missing annotations and typing.Any
+    """
+
+    __slots__ = ()
+
+    def __call__(self, arg: Any) -> bool:
+        return True
+
+    @property
+    def type_determined(self) -> bool:
+        return True
+
+    def source(self, var: str, namespace: dict, depth: int = 0) -> str:
+        return "True"
+
+
+class ValidationChecker(Checker):
+    """
+    for typing.Any inside of an IterValidator
+    """
+
+    __slots__ = ("validation_with",)
+
+    def __init__(self, annotation, validation_with):
+        super().__init__(annotation)
+        self.validation_with = validation_with
+
+    def __call__(self, arg: Any) -> bool:
+        return is_generator(arg) or validate_object(arg, self.validation_with)
+
+
+class InstanceChecker(Checker):
+    """
+    for classes and unions which only contain classes
+    """
+
+    __slots__ = ("validation_with",)
+
+    def __init__(self, annotation, validation_with=None):
+        super().__init__(annotation)
+        self.validation_with = validation_with
+
+    @property
+    def plain_type(self):
+        """
+        the class (or tuple of classes) if a plain isinstance check is enough
+        """
+        return None if self.validation_with else self.annotation
+
+    @property
+    def type_determined(self) -> bool:
+        return self.validation_with is None
+
+    def fast_source(self, var: str, namespace: dict, depth: int = 0) -> typing.Optional[str]:
+        if self.plain_type is None:
+            return None
+        return f"isinstance({var}, {add_to_namespace(namespace, self.plain_type, 't')})"
+
+    def __call__(self, arg: Any) -> bool:
+        if self.validation_with is not None and is_generator(arg):
+            return True
+        # `is True` because numpy arrays compare elementwise
+        if isinstance(arg, self.annotation) or (arg == self.annotation) is True:
+            return validate_object(arg, self.validation_with)
+        return is_generator(arg)
+
+
+class ClassNameChecker(Checker):
+    """
+    for annotations written as string
+    """
+
+    __slots__ = ()
+
+    def __call__(self, arg: Any) -> bool:
+        return arg.__class__.__name__ == self.annotation or is_generator(arg)
+
+    @property
+    def type_determined(self) -> bool:
+        return True
+
+
+class DuckTypingChecker(Checker):
+    __slots__ = ()
+
+    def __call__(self, arg: Any) -> bool:
+        return is_generator(arg) or check_duck_typing(arg, self.annotation)
+
+
+class JsonChecker(Checker):
+    __slots__ = ()
+
+    def __call__(self, arg: Any) -> bool:
+        return is_generator(arg) or checking_typing_json(arg, self.annotation)
+
+
+class ModuleChecker(Checker):
+    """
+    delegates the whole check to the strongtyping_modules extension
+    """
+
+    __slots__ = ("module_func",)
+
+    def __init__(self, annotation, module_func):
+        super().__init__(annotation)
+        self.module_func = module_func
+
+    def __call__(self, arg: Any) -> bool:
+        return is_generator(arg) or self.module_func(arg, self.annotation)
+
+
+class ContainerChecker(Checker):
+    __slots__ = ("container", "item", "item_type", "select", "annotation_args")
+
+    def __init__(self, annotation, container, item=None, select=None):
+        super().__init__(annotation)
+        self.container = container
+        self.item = item
+        self.item_type = getattr(item, "plain_type", None)
+        self.select = select
+        self.annotation_args = getattr(annotation, "__args__", None)
+
+    def check_items(self, items) -> bool:
+        if self.item is None:
+            return True
+        if self.select is not None:
+            items = self.select(items)
+        if self.item_type is not None:
+            # most of the time all elements will match so try the cheap check first
+            if all(map(isinstance, items, repeat(self.item_type))):
+                return True
+        item = self.item
+        return all(item(element) for element in items)
+
+    def __call__(self, arg: Any) -> bool:
+        if not isinstance(arg, self.container):
+            return is_generator(arg)
+        if type(arg) is not self.container and is_known_valid(arg, self.annotation_args):
+            return True
+        return self.check_items(arg)
+
+    @property
+    def type_determined(self) -> bool:
+        return self.item is None
+
+    def fast_source(self, var: str, namespace: dict, depth: int = 0) -> typing.Optional[str]:
+        type_check = f"type({var}) is {self.container.__name__}"
+        if self.item is None:
+            return type_check
+        items = var
+        if self.select is not None:
+            items = f"{add_to_namespace(namespace, self.select, 's')}({var})"
+        return f"{type_check} and {all_items_source(self.item, items, namespace, depth)}"
+
+
+class ListChecker(ContainerChecker):
+    __slots__ = ()
+
+    def __init__(self, annotation, item=None, select=None):
+        super().__init__(annotation, list, item, select)
+
+
+class SetChecker(ContainerChecker):
+    __slots__ = ()
+
+    def __init__(self, annotation, item=None, select=None):
+        super().__init__(annotation, set, item, select)
+
+
+class DictChecker(Checker):
+    __slots__ = ("key", "value", "select", "annotation_args")
+
+    def __init__(self, annotation, key=None, value=None, select=None):
+        super().__init__(annotation)
+        self.key = key
+        self.value = value
+        self.select = select
+        self.annotation_args = getattr(annotation, "__args__", None)
+
+    def __call__(self, arg: Any) -> bool:
+        if not isinstance(arg, dict):
+            return is_generator(arg)
+        if self.key is None:
+            return True
+        if type(arg) is not dict and is_known_valid(arg, self.annotation_args):
+            return True
+        if self.select is not None:
+            return all(self.key(key) and self.value(arg[key]) for key in self.select(arg))
+        return all(self.key(key) for key in arg.keys()) and all(
+            self.value(val) for val in arg.values()
+        )
+
+    @property
+    def type_determined(self) -> bool:
+        return self.key is None
+
+    def fast_source(self, var: str, namespace: dict, depth: int = 0) -> typing.Optional[str]:
+        if self.key is None:
+            return f"type({var}) is dict"
+        if self.select is not None:
+            return None
+        key_check = all_items_source(self.key, var, namespace, depth)
+        value_check = all_items_source(self.value, f"{var}.values()", namespace, depth)
+        return f"type({var}) is dict and {key_check} and {value_check}"
+
+
+class TupleChecker(Checker):
+    __slots__ = ("items",)
+
+    def __init__(self, annotation, items=None):
+        super().__init__(annotation)
+        self.items = items
+
+    def __call__(self, arg: Any) -> bool:
+        if not isinstance(arg, tuple):
+            return is_generator(arg)
+        if self.items is None:
+            return True
+        return len(arg) == len(self.items) and all(
+            item(argument) for item, argument in zip(self.items, arg)
+        )
+
+    @property
+    def type_determined(self) -> bool:
+        return self.items is None
+
+    def fast_source(self, var: str, namespace: dict, depth: int = 0) -> typing.Optional[str]:
+        if self.items is None:
+            return f"type({var}) is tuple"
+        item_checks = " and ".join(
+            item.source(f"{var}[{index}]", namespace, depth)
+            for index, item in enumerate(self.items)
+        )
+        return f"type({var}) is tuple and len({var}) == {len(self.items)} and {item_checks}"
+
+
+class EllipsisTupleChecker(ContainerChecker):
+    """
+    for Tuple[int, ...]
+    """
+
+    __slots__ = ()
+
+    def __init__(self, annotation, item, select=None):
+        super().__init__(annotation, tuple, item, select)
+
+
+class UnionChecker(Checker):
+    __slots__ = ("members",)
+
+    def __init__(self, annotation, members):
+        super().__init__(annotation)
+        self.members = members
+
+    def __call__(self, arg: Any) -> bool:
+        return any(member(arg) for member in self.members) or is_generator(arg)
+
+    @property
+    def type_determined(self) -> bool:
+        return all(member.type_determined for member in self.members)
+
+    def fast_source(self, var: str, namespace: dict, depth: int = 0) -> typing.Optional[str]:
+        return " or ".join(member.source(var, namespace, depth) for member in self.members)
+
+
+class IterableChecker(Checker):
+    __slots__ = ("item", "item_type", "select")
+
+    def __init__(self, annotation, item, select=None):
+        super().__init__(annotation)
+        self.item = item
+        self.item_type = getattr(item, "plain_type", None)
+        self.select = select
+
+    def __call__(self, arg: Any) -> bool:
+        # a generator will be exhausted when we check it, so we accept it without any checking
+        if is_generator(arg):
+            return True
+        if not hasattr(arg, "__iter__"):
+            return False
+        if self.item_type is not None:
+            # buffers and numpy arrays know the type of their items
+            items_match = items_match_by_type(arg, self.item_type)
+            if items_match is not None:
+                return items_match
+        if self.select is not None:
+            arg = self.select(arg)
+        return all(self.item(argument) for argument in arg)
+
+
+class NDArrayChecker(Checker):
+    """
+    for NDArray[dtype, shape], only the dtype and shape of the array will be checked
+    """
+
+    __slots__ = ()
+
+    def __call__(self, arg: Any) -> bool:
+        return isinstance(arg, self.annotation)
+
+
+class RegisteredChecker(Checker):
+    """
+    for annotations with a checker added by `register_checker`
+    """
+
+    __slots__ = ("checker",)
+
+    def __init__(self, annotation, checker):
+        super().__init__(annotation)
+        self.checker = checker
+
+    def __call__(self, arg: Any) -> bool:
+        return self.checker(arg, self.annotation)
+
+
+class FallbackChecker(Checker):
+    """
+    for everything which has no compiled checker, uses `check_type` on every call
+    """
+
+    __slots__ = ("kwargs",)
+
+    def __init__(self, annotation, **kwargs):
+        super().__init__(annotation)
+        self.kwargs = kwargs
+
+    def __call__(self, arg: Any) -> bool:
+        return check_type(arg, self.annotation, mro=False, **self.kwargs)
+
+
+PASS_CHECKER = PassChecker(None)
+
+NOT_CACHEABLE = object()
+IMMUTABLE_SCALARS = (int, float, complex, bool, str, bytes, type(None))
+IMMUTABLE_CONTAINERS = (tuple, frozenset)
+# longer str and bytes are not cached, hashing them would cost more than checking them
+MAX_CACHED_LENGTH = 1024
+
+
+class Identity:
+    """
+    Compares by identity and keeps a reference to `obj`,
+    so that its id cannot be reused by another object as long as it is cached.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, Identity) and other.obj is self.obj
+
+    def __sizeof__(self):
+        # the cache keeps `obj` alive, so it belongs to the memory usage of the cache
+        return object.__sizeof__(self) + get_size(self.obj)
+
+
+def argument_fingerprint(arg: Any, type_determined: bool, identity: bool = False):
+    """
+    :return: a cheap hashable which results in the same check result for all arguments
+        with the same fingerprint or NOT_CACHEABLE
+    """
+    arg_type = type(arg)
+    if type_determined:
+        # a class can be compared against the annotation itself
+        return arg if isinstance(arg, type) else arg_type
+    if arg_type in IMMUTABLE_SCALARS:
+        if (arg_type is str or arg_type is bytes) and len(arg) > MAX_CACHED_LENGTH:
+            return NOT_CACHEABLE
+        return arg_type, arg
+    if identity and arg_type in IMMUTABLE_CONTAINERS:
+        try:
+            # only hashable items cannot be changed later on, e.g. a list inside a tuple can
+            hash(arg)
+        except TypeError:
+            return NOT_CACHEABLE
+        return Identity(arg)
+    return NOT_CACHEABLE
+
+
+def _compile_container(type_of, origin, origin_name: str, **kwargs):
+    """
+    :return: a compiled checker for List, Set, Dict, Tuple, Union and Iterable
+        or None if there is none for this origin
+    """
+    possible_types = get_possible_types(type_of, origin_name)
+    validation_with = kwargs.get("validation_with")
+    kwargs = {key: val for key, val in kwargs.items() if val is not None}
+    select = element_selector(**kwargs)
+
+    if origin is list or origin is set:
+        checker_cls = ListChecker if origin is list else SetChecker
+        if not possible_types:
+            return checker_cls(type_of)
+        return checker_cls(type_of, compile_checker(possible_types[0], **kwargs), select)
+
+    if origin is dict:
+        if not possible_types:
+            return DictChecker(type_of)
+        try:
+            key, val = possible_types
+        except (ValueError, TypeError):
+            return DictChecker(type_of)
+        # keys and values of a dict are never validated
+        kwargs.pop("validation_with", None)
+        return DictChecker(
+            type_of, compile_checker(key, **kwargs), compile_checker(val, **kwargs), select
+        )
+
+    if origin is tuple:
+        if not possible_types:
+            return TupleChecker(type_of)
+        if Ellipsis in possible_types:
+            item = [pt for pt in possible_types if pt is not Ellipsis][0]
+            return EllipsisTupleChecker(type_of, compile_checker(item, **kwargs), select)
+        return TupleChecker(
+            type_of, tuple(compile_checker(typ, **kwargs) for typ in possible_types)
+        )
+
+    if origin is typing.Union:
+        if all(isinstance(typ, type) and typ is not Any for typ in possible_types):
+            return InstanceChecker(possible_types, validation_with)
+        return UnionChecker(
+            type_of, tuple(compile_checker(typ, **kwargs) for typ in possible_types)
+        )
+
+    if origin is collections.abc.Iterable and possible_types:
+        return IterableChecker(type_of, compile_checker(possible_types[0], **kwargs), select)
+    return None
+
+
+# all decorated functions share one checker per annotation and options
+_interned_checkers: Dict[tuple, Checker] = {}
+_checker_cache_stats = {"hits": 0, "misses": 0}
+
+
+def compile_checker(type_of, check_duck_typing: bool = False, **kwargs) -> Checker:
+    """
+    resolves everything `check_type` would do on each call for `type_of` once,
+    equal annotations with the same options are compiled only once
+
+    :param type_of: the annotation of a parameter
+    :return: a callable which only needs the argument to check it against the annotation
+    """
+    if type_of is None:
+        return PASS_CHECKER
+    try:
+        key = (type_of, check_duck_typing, frozenset(kwargs.items()))
+        checker = _interned_checkers.get(key)
+    except TypeError:
+        # unhashable annotation or option
+        return _compile_checker(type_of, check_duck_typing, **kwargs)
+    if checker is not None:
+        _checker_cache_stats["hits"] += 1
+        return checker
+    _checker_cache_stats["misses"] += 1
+    checker = _compile_checker(type_of, check_duck_typing, **kwargs)
+    # another thread could have compiled the same annotation meanwhile
+    return _interned_checkers.setdefault(key, checker)
+
+
+def checker_cache_info() -> dict:
+    """
+    :return: the number of interned checkers, cache hits and misses of `compile_checker`
+    """
+    return {"checkers": len(_interned_checkers), **_checker_cache_stats}
+
+
+def checker_stats() -> List[dict]:
+    """
+    :return: the checks and failures of the shared checkers counted by the functions
+        decorated with `stats=True`, the most used checkers first
+    """
+    return sorted(
+        (
+            {"checker": repr(checker), "checks": checker.checks, "failures": checker.failures}
+            for checker in _interned_checkers.values()
+            if checker.checks
+        ),
+        key=lambda entry: entry["checks"],
+        reverse=True,
+    )
+
+
+def reset_checker_stats():
+    for checker in _interned_checkers.values():
+        checker.checks = 0
+        checker.failures = 0
+
+
+def clear_checker_cache():
+    """
+    already decorated functions keep their checkers
+    """
+    _interned_checkers.clear()
+    _checker_cache_stats.update(hits=0, misses=0)
+
+
+def _compile_checker(type_of, check_duck_typing: bool = False, **kwargs) -> Checker:
+    validation_with = kwargs.get("validation_with")
+    fallback_kwargs = dict(kwargs, check_duck_typing=check_duck_typing)
+
+    if type_of is None:
+        return PASS_CHECKER
+    registered_checker = get_registered_checker(type_of)
+    if registered_checker is not None:
+        return RegisteredChecker(type_of, registered_checker)
+    if isinstance(type_of, NDArrayType):
+        return NDArrayChecker(type_of)
+    if type_of is Any:
+        if validation_with:
+            return ValidationChecker(type_of, validation_with)
+        return PassChecker(type_of)
+
+    origin, origin_name = get_origins(type_of)
+    if not isinstance(origin_name, str):
+        origin_name = str(origin_name)
+    origin_name = origin_name.lower()
+
+    if "any" in origin_name:
+        if validation_with:
+            return ValidationChecker(type_of, validation_with)
+        return PassChecker(type_of)
+    if "json" in origin_name or "json" in str(type_of):
+        return JsonChecker(type_of)
+
+    module_func = supported_modules.get(f"module_checking_typing_{origin_name}")
+    if module_func is not None:
+        return ModuleChecker(type_of, module_func)
+
+    if "new_type" in origin_name:
+        return FallbackChecker(type_of, **fallback_kwargs)
+
+    type_origin = getattr(type_of, "__origin__", None)
+    if check_duck_typing:
+        if isinstance(type_of, type):
+            return DuckTypingChecker(type_of)
+        return FallbackChecker(type_of, **fallback_kwargs)
+
+    if isinstance(type_of, typing_base_class) or (py_version >= 9 and origin is not None):
+        checker = _compile_container(type_of, type_origin, origin_name, **kwargs)
+        if checker is not None:
+            return checker
+        return FallbackChecker(type_of, **fallback_kwargs)
+    if isinstance(type_of, str):
+        return ClassNameChecker(type_of)
+    if isinstance(type_of, type) or type_origin is None and hasattr(type_of, "__args__"):
+        # the later one are unions like `int | str`
+        try:
+            isinstance(None, type_of)
+        except TypeError:
+            return FallbackChecker(type_of, **fallback_kwargs)
+        return InstanceChecker(type_of, validation_with)
+    return FallbackChecker(type_of, **fallback_kwargs)
+
+
+ITERATOR_ORIGINS = (collections.abc.Iterator, collections.abc.Generator, collections.abc.Iterable)
+ASYNC_ITERATOR_ORIGINS = (
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncGenerator,
+    collections.abc.AsyncIterable,
+)
+
+
+def iterator_item_type(type_of, origins: tuple = ITERATOR_ORIGINS):
+    """
+    :return: the type of the items of an Iterator, Generator or Iterable annotation
+        or None if there is nothing to check
+    """
+    if getattr(type_of, "__origin__", None) not in origins:
+        return None
+    item_types = getattr(type_of, "__args__", None) or (None,)
+    item_type = item_types[0]
+    if item_type is Any or isinstance(item_type, typing.TypeVar):
+        return None
+    return item_type
+
+
+class IteratorProxy:
+    """
+    Replaces an iterator argument and checks every item when it is consumed,
+    so the iterator will not be exhausted by the check.
+    """
+
+    __slots__ = ("iterator", "item", "name", "on_failure")
+
+    def __init__(self, iterator, item: Checker, name: str, on_failure: Callable[[str, Any], None]):
+        self.iterator = iterator
+        self.item = item
+        self.name = name
+        self.on_failure = on_failure
+
+    def checked(self, value):
+        if not self.item(value):
+            self.on_failure(self.name, value)
+        return value
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.checked(next(self.iterator))
+
+    def send(self, value):
+        return self.checked(self.iterator.send(value))
+
+    def throw(self, *args):
+        return self.checked(self.iterator.throw(*args))
+
+    def close(self):
+        close = getattr(self.iterator, "close", None)
+        if close is not None:
+            close()
+
+    def __getattr__(self, item):
+        return getattr(self.iterator, item)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.iterator!r})"
+
+
+# the arguments of these checkers can change between two calls, so they are never cached
+MUTABLE_CONTAINER_CHECKERS = (ListChecker, SetChecker, DictChecker)
+
+
+class CheckerPlan:
+    """
+    The compiled checkers for all parameters of a function.
+
+    Built once when the function gets decorated so that a call only has to run the checkers.
+    """
+
+    __slots__ = (
+        "arg_names",
+        "checkers",
+        "positional",
+        "type_determined",
+        "iterators",
+        "returns",
+        "worth_caching",
+    )
+
+    def __init__(
+        self,
+        arg_names,
+        annotations: dict,
+        wrap_iterators: bool = False,
+        check_return: bool = False,
+        **kwargs,
+    ):
+        self.arg_names = tuple(arg_names)
+        self.checkers = {
+            name: compile_checker(annotations.get(name), **kwargs) for name in self.arg_names
+        }
+        # the checker of the return value or None if it will not be checked
+        self.returns = None
+        if check_return and "return" in annotations:
+            return_type = annotations["return"]
+            # `-> None` is stored as None and not as NoneType
+            returns = compile_checker(type(None) if return_type is None else return_type, **kwargs)
+            if returns is not PASS_CHECKER:
+                self.returns = returns
+        # the items of these parameters will be checked when they are consumed
+        iterators = []
+        if wrap_iterators:
+            for index, name in enumerate(self.arg_names):
+                item_type = iterator_item_type(annotations.get(name))
+                if item_type is not None:
+                    iterators.append((index, name, compile_checker(item_type, **kwargs)))
+        self.iterators = tuple(iterators)
+        # parameters without annotation will never fail, so we skip them completely
+        self.positional = tuple(
+            (index, name, self.checkers[name])
+            for index, name in enumerate(self.arg_names)
+            if self.checkers[name] is not PASS_CHECKER
+        )
+        self.type_determined = tuple(checker.type_determined for _, _, checker in self.positional)
+        # if every checker is a plain type check, building the fingerprint and looking it up
+        # costs more than the check itself, a checked list, set or dict is never cached at all
+        checked = [checker for checker in self.checkers.values() if not checker.type_determined]
+        self.worth_caching = bool(checked) and not any(
+            isinstance(checker, MUTABLE_CONTAINER_CHECKERS) for checker in checked
+        )
+
+    def failed_params(self, args: tuple, kwargs: dict) -> tuple:
+        args_len = len(args)
+        failed_params = ()
+        for index, name, checker in self.positional:
+            if index < args_len and not checker(args[index]):
+                failed_params += (name,)
+        if kwargs:
+            checkers = self.checkers
+            failed_params += tuple(
+                kwarg_name
+                for kwarg_name, kwarg in kwargs.items()
+                if kwarg_name in checkers and not checkers[kwarg_name](kwarg)
+            )
+        return failed_params
+
+    def count_checks(self, args: tuple, kwargs: dict, failed_params: tuple):
+        """
+        counts the checks and failures of the used checkers, only called if stats are enabled
+        """
+        args_len = len(args)
+        for index, name, checker in self.positional:
+            if index < args_len:
+                checker.checks += 1
+                if name in failed_params:
+                    checker.failures += 1
+        for kwarg_name in kwargs:
+            checker = self.checkers.get(kwarg_name, PASS_CHECKER)
+            if checker is not PASS_CHECKER:
+                checker.checks += 1
+                if kwarg_name in failed_params:
+                    checker.failures += 1
+
+    def wrap_iterators(self, args: tuple, kwargs: dict, on_failure: Callable[[str, Any], None]):
+        """
+        replaces all iterator arguments with an IteratorProxy
+
+        :param on_failure: will be called with the parameter name and the item
+            if an item does not match
+        :return: the args and kwargs for the function
+        """
+        args_len = len(args)
+        for index, name, item in self.iterators:
+            if index < args_len:
+                if checking_typing_iterator(args[index]):
+                    proxy = IteratorProxy(args[index], item, name, on_failure)
+                    args = args[:index] + (proxy,) + args[index + 1 :]
+            elif name in kwargs and checking_typing_iterator(kwargs[name]):
+                kwargs[name] = IteratorProxy(kwargs[name], item, name, on_failure)
+        return args, kwargs
+
+    def fingerprint(self, args: tuple, kwargs: dict, identity: bool = False):
+        """
+        a structural cache key for a call, which only depends on the number of parameters
+        and not on the size of the arguments
+
+        :param identity: use the identity of tuples and frozensets for parameters
+            which cannot be decided by the type of the argument
+        :return: the key or None if the call cannot be cached
+        """
+        args_len = len(args)
+        fingerprint = []
+        for (index, _, _), type_determined in zip(self.positional, self.type_determined):
+            if index < args_len:
+                key = argument_fingerprint(args[index], type_determined, identity)
+                if key is NOT_CACHEABLE:
+                    return None
+                fingerprint.append(key)
+        fingerprint.append(args_len)
+        for kwarg_name, kwarg in kwargs.items():
+            checker = self.checkers.get(kwarg_name, PASS_CHECKER)
+            key = argument_fingerprint(kwarg, checker.type_determined, identity)
+            if key is NOT_CACHEABLE:
+                return None
+            fingerprint.append((kwarg_name, key))
+        return tuple(fingerprint)
+
+    @property
+    def return_worth_caching(self) -> bool:
+        return self.returns is not None and not self.returns.type_determined
+
+    def return_fingerprint(self, result: Any, identity: bool = False):
+        """
+        :return: a cache key for the return value or None if it cannot be cached
+        """
+        key = argument_fingerprint(result, self.returns.type_determined, identity)
+        if key is NOT_CACHEABLE:
+            return None
+        # argument fingerprints never start with a string
+        return "return", key
+
+    def __repr__(self):
+        return f"CheckerPlan({self.checkers})"
+
+
+class CodegenCheckerPlan(CheckerPlan):
+    """
+    Generates and executes a dedicated function which checks all parameters of a signature
+    with inlined isinstance/type checks, the generated code can be viewed with `source`.
+    """
+
+    def __init__(self, arg_names, annotations: dict, func_name: str = "function", **kwargs):
+        super().__init__(arg_names, annotations, **kwargs)
+        func_name = re.sub(r"\W", "_", func_name)
+        namespace = {"_checkers": self.checkers, "repeat": repeat}
+
+        lines = [
+            f"def check_{func_name}(args, kwargs):",
+            "    failed_params = ()",
+            "    args_len = len(args)",
+        ]
+        for index, name, checker in self.positional:
+            var = f"_a{index}"
+            lines += [
+                f"    if args_len > {index}:",
+                f"        {var} = args[{index}]",
+                f"        if not {checker.source(var, namespace)}:",
+                f"            failed_params += ({name!r},)",
+            ]
+        lines += [
+            "    if kwargs:",
+            "        failed_params += tuple(",
+            "            kwarg_name",
+            "            for kwarg_name, kwarg in kwargs.items()",
+            "            if kwarg_name in _checkers and not _checkers[kwarg_name](kwarg)",
+            "        )",
+            "    return failed_params",
+        ]
+        self.source = "\n".join(lines) + "\n"
+
+        import linecache
+        import zlib
+
+        # the same source results in the same filename, so the compiled code can be cached
+        filename = f"<strongtyping {func_name}-{zlib.crc32(self.source.encode()):08x}>"
+        # makes the generated code visible in tracebacks
+        linecache.cache[filename] = (len(self.source), None, self.source.splitlines(True), filename)
+        exec(compile_cached(self.source, filename), namespace)
+        self.failed_params = namespace[f"check_{func_name}"]
+
+    def __repr__(self):
+        return f"CodegenCheckerPlan({self.checkers})"
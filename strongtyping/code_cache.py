@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import marshal
+import os
+import sys
+from types import CodeType
+from typing import Optional
+
+# increase it when the format of the cached files changes
+CACHE_VERSION = 1
+CACHE_TAG = f"strongtyping-{CACHE_VERSION}.{sys.implementation.cache_tag}"
+
+
+def cache_dir() -> Optional[str]:
+    """
+    :return: the directory of the cached code from `ST_CACHE_DIR`, None if caching is disabled
+    """
+    return os.environ.get("ST_CACHE_DIR") or None
+
+
+def cache_path(directory: str, source: str, filename: str) -> str:
+    """
+    :return: the file of the compiled code, it depends on the generated source itself
+        so a changed annotation or strongtyping version can never load outdated code
+    """
+    # hashlib imports openssl, which is only worth it when the cache is used
+    import hashlib
+
+    digest = hashlib.sha256(f"{filename}\0{source}".encode()).hexdigest()
+    return os.path.join(directory, CACHE_TAG, f"{digest}.code")
+
+
+def load_code(path: str) -> Optional[CodeType]:
+    try:
+        with open(path, "rb") as file:
+            code = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return code if isinstance(code, CodeType) else None
+
+
+def write_code(path: str, code: CodeType):
+    """
+    writes into a temporary file first and renames it afterwards,
+    so concurrent readers and writers never see a partially written file
+    """
+    import threading
+
+    directory = os.path.dirname(path)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with open(temp_path, "wb") as file:
+            marshal.dump(code, file)
+        os.replace(temp_path, path)
+    except OSError:
+        # a read only or full file system only costs the compilation on the next start
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def compile_cached(source: str, filename: str) -> CodeType:
+    """
+    like `compile(source, filename, "exec")` but reuses the code compiled by a previous process
+    if `ST_CACHE_DIR` is set
+    """
+    directory = cache_dir()
+    if directory is None:
+        return compile(source, filename, "exec")
+    path = cache_path(directory, source, filename)
+    code = load_code(path)
+    if code is None:
+        code = compile(source, filename, "exec")
+        write_code(path, code)
+    return code
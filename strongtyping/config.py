@@ -9,6 +9,8 @@ from os import environ
 
 
 class SEVERITY_LEVEL(Enum):
+    # the decorators return the undecorated function/class
+    STRIP = -1
     DISABLED = 0
     ENABLED = 1
     WARNING = 2
@@ -18,5 +20,77 @@ class SEVERITY_LEVEL(Enum):
         return str(self.value)
 
 
+SEVERITY_CONFIG = {
+    "warning": SEVERITY_LEVEL.WARNING,
+    "disable": SEVERITY_LEVEL.DISABLED,
+    "enable": SEVERITY_LEVEL.ENABLED,
+    "strip": SEVERITY_LEVEL.STRIP,
+}
+
+
+class Settings:
+    """
+    Process wide settings, the functions decorated with `severity="env"` read them with every call
+    so a change takes effect immediately.
+
+    `ST_SEVERITY` is read once when strongtyping is imported, afterwards only by `refresh`.
+    """
+
+    __slots__ = ("severity",)
+
+    def __init__(self):
+        self.refresh()
+
+    def refresh(self) -> int:
+        """
+        takes over the current `ST_SEVERITY`
+        :return: the current severity level
+        """
+        env_severity = environ.get("ST_SEVERITY", "1")
+        try:
+            self.severity = int(env_severity)
+        except (TypeError, ValueError):
+            self.severity = SEVERITY_CONFIG[env_severity].value
+        return self.severity
+
+
+settings = Settings()
+
+
+class FixedSeverity:
+    """
+    Read like `settings` by the functions decorated with an explicit severity,
+    so the checking code does not need to know where its severity comes from.
+    """
+
+    __slots__ = ("severity",)
+
+    def __init__(self, severity: int):
+        self.severity = severity
+
+
 def set_severity_level(_level: SEVERITY_LEVEL):
     environ["ST_SEVERITY"] = _level.value_as_str
+    settings.refresh()
+
+
+def set_sample_rate(sample_rate: float):
+    environ["ST_SAMPLE_RATE"] = str(sample_rate)
+
+
+def set_stats(enabled: bool):
+    environ["ST_STATS"] = str(int(enabled))
+
+
+def set_lazy(enabled: bool):
+    """
+    the decorated functions will be compiled with their first call instead of the decoration
+    """
+    environ["ST_LAZY"] = str(int(enabled))
+
+
+def set_cache_dir(path: str):
+    """
+    the code generated with `codegen=True` will be cached in this directory
+    """
+    environ["ST_CACHE_DIR"] = path
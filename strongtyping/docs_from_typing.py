@@ -10,6 +10,7 @@ import re
 import textwrap
 from functools import wraps
 
+from strongtyping._utils import _is_stripped
 from strongtyping.strong_typing_utils import get_origins, get_possible_types
 
 Pattern = re.compile(r"(\$\d[a-zA-Z0-9, ()\n]+)")
@@ -261,6 +262,9 @@ def docs_from_typing(func, remove_linebreak, style):
 
 def rest_docs_from_typing(_func=None, *, insert_at: str = None, remove_linebreak: bool = False):
     def wrapper(func):
+        if _is_stripped():
+            return func
+
         @wraps(func)
         def inner(*args, **kwargs):
             return func(*args, **kwargs)
@@ -282,6 +286,9 @@ def rest_docs_from_typing(_func=None, *, insert_at: str = None, remove_linebreak
 
 def numpy_docs_from_typing(_func=None, *, insert_at: str = None, remove_linebreak: bool = False):
     def wrapper(func):
+        if _is_stripped():
+            return func
+
         @wraps(func)
         def inner(*args, **kwargs):
             return func(*args, **kwargs)
@@ -303,6 +310,8 @@ def numpy_docs_from_typing(_func=None, *, insert_at: str = None, remove_linebrea
 
 def class_docs_from_typing(_cls=None, *, doc_type: str = "reST"):
     def wrapper(cls):
+        if _is_stripped():
+            return cls
         docs_formatter = (
             rest_docs_from_typing if doc_type.lower() == "rest" else numpy_docs_from_typing
         )
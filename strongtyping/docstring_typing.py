@@ -12,8 +12,16 @@ import typing
 import warnings
 from types import FunctionType, MethodType
 
-from strongtyping._utils import _get_new, _severity_level, action, remove_subclass
+from strongtyping._utils import (
+    _get_new,
+    _is_stripped,
+    _severity_level,
+    action,
+    call_sampler,
+    remove_subclass,
+)
 from strongtyping.cached_set import CachedSet
+from strongtyping.config import SEVERITY_LEVEL, settings
 from strongtyping.strong_typing import TypeMisMatch
 
 TYPE_EXTRACTION_PATTERN = r"(^[:a-zA-Z0-9 _-]+(:))"
@@ -107,19 +115,66 @@ def is_function_or_method_type(arg, type_of):
 options = {"tuple": is_tuple, "list": is_list, "set": is_set, "dict": is_dict}
 
 
+def accept_all(arg) -> bool:
+    return True
+
+
+def compile_container_type(container: type, type_of: str) -> typing.Callable[[typing.Any], bool]:
+    try:
+        container_types = get_container_types(type_of)
+        if container is dict and container_types:
+            key_type, val_type = container_types[:2]
+    except (AttributeError, IndexError, ValueError):
+        # invalid docstring types raise on every call, like they did before
+        return functools.partial(options[container.__name__], type_of=type_of)
+
+    if container is set or not container_types:
+        return lambda arg: isinstance(arg, container)
+    if container is tuple:
+        return lambda arg: (
+            isinstance(arg, tuple)
+            and all(isinstance(a, container_types) for a in arg)
+            and len(arg) == len(container_types)
+        )
+    if container is list:
+        return lambda arg: isinstance(arg, list) and all(
+            isinstance(a, container_types) for a in arg
+        )
+    return lambda arg: (
+        isinstance(arg, dict)
+        and all(isinstance(k, key_type) for k in arg.keys())
+        and all(isinstance(v, val_type) for v in arg.values())
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_doc_str_type(type_of: typing.Optional[str]) -> typing.Callable[[typing.Any], bool]:
+    """
+    resolves a type from a docstring once, so that a call only has to run the returned checker
+
+    :param type_of: the type from the docstring e.g. `int`, `list(int)` or `int or float`
+    :return: a callable which returns True if the argument matches `type_of`
+    """
+    if type_of is None:
+        return accept_all
+    container_name = re.split(REMOVE_PATTERN, type_of)[0]
+    if container_name in options:
+        return compile_container_type(getattr(builtins, container_name), type_of)
+    if len(re.findall(FM_PATTERN, type_of)) == 1:
+        if type_of[0] == "F":
+            return lambda arg: isinstance(arg, FunctionType)
+        if type_of[0] == "M":
+            return lambda arg: isinstance(arg, MethodType)
+        return functools.partial(is_function_or_method_type, type_of=type_of)
+    try:
+        types = tuple(map(param_attr, get_or_types(type_of)))
+    except AttributeError:
+        return lambda arg: arg.__class__.__name__ == type_of
+    return lambda arg: isinstance(arg, types)
+
+
 def check_doc_str_type(arg, type_of):
-    check_result = True
-    if type_of is not None:
-        try:
-            return options[re.split(REMOVE_PATTERN, type_of)[0]](arg, type_of)
-        except KeyError:
-            if len(re.findall(FM_PATTERN, type_of)) == 1:
-                return is_function_or_method_type(arg, type_of)
-            try:
-                return isinstance(arg, tuple(map(param_attr, get_or_types(type_of))))
-            except AttributeError:
-                return arg.__class__.__name__ == type_of
-    return check_result
+    return compile_doc_str_type(type_of)(arg)
 
 
 def is_type_info(docstring_line: str) -> bool:
@@ -162,16 +217,33 @@ def match_docstring(
     severity="env",
     **kwargs,
 ):
-    cached_set = None if cache_size == 0 else CachedSet(cache_size)
+    cached_set = (
+        None
+        if cache_size == 0
+        else CachedSet(cache_size, ttl=kwargs.get("cache_ttl"), accurate_size=True)
+    )
+    sample_rate = kwargs.get("sample_rate", "env")
 
     def wrapper(func):
-        docstring_types = extract_docstring_param_types(func)
-
+        if _is_stripped(severity):
+            return func
         severity_level = _severity_level(severity)
+        # with "env" the level can be changed while the program runs
+        follows_settings = severity == "env"
+
+        docstring_types = extract_docstring_param_types(func)
+        # self and cls are always an instance of the class or the class itself
+        checkers = {
+            name: accept_all if name in ("self", "cls") else compile_doc_str_type(type_of)
+            for name, type_of in docstring_types.items()
+        }
+        positional_checkers = tuple(checkers.items())
+        is_sampled = call_sampler(sample_rate)
 
         @functools.wraps(func)
         def inner(*args, **kwargs):
-            if severity_level > 0:
+            level = settings.severity if follows_settings else severity_level
+            if level > 0 and (is_sampled is None or is_sampled()):
                 args = remove_subclass(args, subclass)
 
                 if cached_set is not None:
@@ -181,28 +253,25 @@ def match_docstring(
                     if cached_key in cached_set:
                         return func(*args, **kwargs)
 
-                if "self" in docstring_types:
-                    docstring_types["self"] = args[0].__class__.__name__
-                if "cls" in docstring_types:
-                    docstring_types["cls"] = args[0].__name__
                 # Thanks to Ruud van der Ham who find a better
                 # and more stable solution for check_args
                 failed_params = tuple(
                     arg_name
-                    for arg, arg_name in zip(args, docstring_types)
-                    if not check_doc_str_type(arg, docstring_types.get(arg_name))
-                )
-                failed_params += tuple(
-                    kwarg_name
-                    for kwarg_name, kwarg in kwargs.items()
-                    if not check_doc_str_type(kwarg, docstring_types.get(kwarg_name))
+                    for arg, (arg_name, checker) in zip(args, positional_checkers)
+                    if not checker(arg)
                 )
+                if kwargs:
+                    failed_params += tuple(
+                        kwarg_name
+                        for kwarg_name, kwarg in kwargs.items()
+                        if not checkers.get(kwarg_name, accept_all)(kwarg)
+                    )
                 if failed_params:
                     msg = (
                         f"Incorrect parameters: "
                         f'{", ".join(f"{name}: {docstring_types[name]}" for name in failed_params)}'
                     )
-                    if excep_raise is not None and severity_level == 1:
+                    if excep_raise is not None and level == 1:
                         raise excep_raise(msg)
                     else:
                         warnings.warn(msg, RuntimeWarning)
@@ -230,16 +299,15 @@ def match_class_docstring(
     **kwargs,
 ):
     def wrapper(cls):
+        if _is_stripped(severity):
+            return cls
         severity_level = _severity_level(severity)
-
-        def inner(*args, **kwargs):
-            if severity_level > 0:
-                cls.__new__ = _get_new(match_docstring, excep_raise, cache_size, severity, **kwargs)
-                if hasattr(cls.__init__, "__annotations__"):
-                    cls.__init__ = match_docstring(cls.__init__)
-            return cls(*args, **kwargs)
-
-        return inner
+        if severity == "env" or severity_level > 0:
+            # the methods will be wrapped once with the first instance
+            cls.__new__ = _get_new(match_docstring, excep_raise, cache_size, severity, **kwargs)
+            if hasattr(cls.__init__, "__annotations__"):
+                cls.__init__ = match_docstring(cls.__init__)
+        return cls
 
     if _cls is not None:
         return wrapper(_cls)
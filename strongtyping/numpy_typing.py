@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import sys
+from typing import Any, Optional, Tuple
+
+# numpy is optional, it will only be used when the application imported it already
+# otherwise there cannot be any numpy array which needs to be checked
+
+# the kinds of numpy dtypes whose items match the builtin types
+BUILTIN_KINDS = {bool: "b", int: "iu", float: "f", complex: "c", str: "U", bytes: "S"}
+
+
+def is_ndarray(arg: Any) -> bool:
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(arg, numpy.ndarray)
+
+
+def dtype_matches(dtype, item_type) -> bool:
+    """
+    :param item_type: a class or a tuple of classes
+    :return: True if every item of an array with this dtype is an instance of item_type
+    """
+    if isinstance(item_type, tuple):
+        return any(dtype_matches(dtype, typ) for typ in item_type)
+    return issubclass(dtype.type, item_type) or dtype.kind in BUILTIN_KINDS.get(item_type, "")
+
+
+def ndarray_items_match(arg: Any, item_type) -> Optional[bool]:
+    """
+    decides with the dtype of an one dimensional array whether all items are of item_type,
+    without iterating over the array
+
+    :return: None if arg is no such array and the items need to be checked one by one
+    """
+    if not is_ndarray(arg) or arg.ndim != 1 or arg.dtype.kind == "O":
+        return None
+    return dtype_matches(arg.dtype, item_type)
+
+
+class NDArrayType:
+    """
+    Annotation for numpy arrays which is checked with the dtype and the shape of an array only
+
+    - NDArray: any numpy array
+    - NDArray[float]: an array of any float dtype
+    - NDArray[numpy.int32, (None, 3)]: an array of int32 with two dimensions and 3 columns
+    """
+
+    __slots__ = ("dtype", "shape", "kinds")
+
+    def __init__(self, dtype=None, shape: Optional[Tuple[Optional[int], ...]] = None):
+        self.kinds = None
+        if dtype is Any:
+            dtype = None
+        if dtype in BUILTIN_KINDS:
+            self.kinds = BUILTIN_KINDS[dtype]
+        elif dtype is not None:
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("NDArray with a dtype requires numpy") from None
+            try:
+                dtype = numpy.dtype(dtype)
+            except TypeError:
+                # abstract types like numpy.floating stay as they are
+                if not (isinstance(dtype, type) and issubclass(dtype, numpy.generic)):
+                    raise
+        if shape is not None and not isinstance(shape, tuple):
+            shape = (shape,)
+        self.dtype = dtype
+        self.shape = shape
+
+    def __getitem__(self, parameters):
+        if not isinstance(parameters, tuple):
+            parameters = (parameters,)
+        if len(parameters) > 2:
+            raise TypeError("NDArray takes max 2 values. NDArray[dtype, shape]")
+        return NDArrayType(*parameters)
+
+    def dtype_matches(self, dtype) -> bool:
+        if self.kinds is not None:
+            return dtype.kind in self.kinds
+        if isinstance(self.dtype, type):
+            return issubclass(dtype.type, self.dtype)
+        return self.dtype is None or dtype == self.dtype
+
+    def shape_matches(self, shape: tuple) -> bool:
+        return self.shape is None or (
+            len(shape) == len(self.shape)
+            and all(size is None or size == dim for size, dim in zip(self.shape, shape))
+        )
+
+    def __instancecheck__(self, instance) -> bool:
+        return (
+            is_ndarray(instance)
+            and self.dtype_matches(instance.dtype)
+            and self.shape_matches(instance.shape)
+        )
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, NDArrayType)
+            and self.dtype == other.dtype
+            and self.kinds == other.kinds
+            and self.shape == other.shape
+        )
+
+    def __hash__(self):
+        return hash((NDArrayType, self.kinds, str(self.dtype), self.shape))
+
+    def __repr__(self):
+        if self.dtype is None:
+            return "NDArray"
+        dtype = getattr(self.dtype, "__name__", self.dtype)
+        if self.shape is None:
+            return f"NDArray[{dtype}]"
+        return f"NDArray[{dtype}, {self.shape}]"
+
+
+NDArray = NDArrayType()
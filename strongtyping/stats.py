@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import os
+import time
+from collections import Counter, deque
+from functools import wraps
+from typing import Callable, Dict, Optional, Union
+
+# only the latest check times are kept for the percentiles
+MAX_CHECK_TIMES = 10000
+PERCENTILES = (50, 90, 99)
+
+_registry: Dict[str, "FunctionStats"] = {}
+
+
+def stats_enabled(stats: Union[str, bool, None] = "env") -> bool:
+    if stats is None or stats == "env":
+        return os.environ.get("ST_STATS", "0").lower() in ("1", "true", "enable")
+    return bool(stats)
+
+
+class FunctionStats:
+    """
+    Counts how often a decorated function was called and how much time the type checks took.
+    """
+
+    __slots__ = (
+        "name",
+        "calls",
+        "checked_calls",
+        "cache_hits",
+        "cache_misses",
+        "check_time",
+        "check_times",
+        "failures",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.checked_calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.check_time = 0.0
+        self.check_times = deque(maxlen=MAX_CHECK_TIMES)
+        self.failures = Counter()
+
+    def count_calls(self, func: Callable) -> Callable:
+        @wraps(func)
+        def inner(*args, **kwargs):
+            self.calls += 1
+            return func(*args, **kwargs)
+
+        return inner
+
+    def count_cache_hits(self, is_cached: Callable) -> Callable:
+        def inner(cached_key) -> bool:
+            if is_cached(cached_key):
+                self.cache_hits += 1
+                return True
+            self.cache_misses += 1
+            return False
+
+        return inner
+
+    def time_checks(
+        self, check_arguments: Callable, count_checks: Optional[Callable] = None
+    ) -> Callable:
+        """
+        :param count_checks: called with the args, kwargs and failed parameters of every check,
+            e.g. to count the checks of the shared checkers
+        """
+
+        def inner(args, kwargs):
+            start = time.perf_counter()
+            try:
+                failed_params = check_arguments(args, kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                self.checked_calls += 1
+                self.check_time += duration
+                self.check_times.append(duration)
+            self.failures.update(failed_params)
+            if count_checks is not None:
+                count_checks(args, kwargs, failed_params)
+            return failed_params
+
+        return inner
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        :return: the check time in seconds below which `percent` of the latest checks are
+        """
+        if not self.check_times:
+            return None
+        check_times = sorted(self.check_times)
+        index = min(len(check_times) - 1, int(len(check_times) * percent / 100))
+        return check_times[index]
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "checked_calls": self.checked_calls,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "check_time": self.check_time,
+            **{f"check_time_p{percent}": self.percentile(percent) for percent in PERCENTILES},
+            "failures": dict(self.failures),
+        }
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name}, {self.as_dict()})"
+
+
+def register(func: Callable) -> FunctionStats:
+    """
+    :return: the stats of `func`, functions with the same name share their stats
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    if name not in _registry:
+        _registry[name] = FunctionStats(name)
+    return _registry[name]
+
+
+def get_stats(name: Optional[str] = None) -> Union[FunctionStats, Dict[str, FunctionStats], None]:
+    """
+    :param name: `module.qualname` of a decorated function
+    :return: the stats of this function or of all functions if name is None
+    """
+    if name is None:
+        return dict(_registry)
+    return _registry.get(name)
+
+
+def dump_stats(path: Optional[str] = None) -> dict:
+    """
+    :param path: if given the stats will also be written as json into this file
+    :return: the stats of all functions, the most expensive ones first
+    """
+    stats = {
+        name: function_stats.as_dict()
+        for name, function_stats in sorted(
+            _registry.items(), key=lambda item: item[1].check_time, reverse=True
+        )
+    }
+    if path is not None:
+        import json
+
+        with open(path, "w") as file:
+            json.dump(stats, file, indent=2)
+    return stats
+
+
+def reset_stats():
+    from strongtyping.checker_plan import reset_checker_stats
+
+    for function_stats in _registry.values():
+        function_stats.reset()
+    reset_checker_stats()
@@ -1,80 +1,311 @@
-import inspect
-import pprint
 import sys
 import warnings
 from functools import wraps
-from typing import Type
-
-from strongtyping._utils import _severity_level, action, remove_subclass
+from typing import Optional, Type
+
+from strongtyping._utils import (
+    _is_stripped,
+    _lazy_enabled,
+    _sample_rate,
+    _severity_level,
+    action,
+    call_sampler,
+    remove_subclass,
+)
 from strongtyping.cached_set import CachedSet
-from strongtyping.config import SEVERITY_LEVEL
+from strongtyping.checker_plan import (
+    ASYNC_ITERATOR_ORIGINS,
+    CheckerPlan,
+    CodegenCheckerPlan,
+    compile_checker,
+    iterator_item_type,
+)
+from strongtyping.config import SEVERITY_LEVEL, FixedSeverity, settings
+from strongtyping.stats import register, stats_enabled
 from strongtyping.strong_typing_utils import (
+    CONTAINER_CHECKS,
+    DefaultReturn,
     TypeMisMatch,
     check_type,
     checking_typing_typedict_values,
-    default_return_queue,
     py_version,
 )
 
 IGNORE_FUNCS = ("__init__", "__repr__", "__str__", "__new__")
 
 
+def format_value(value) -> str:
+    # pprint is only imported when there is an error message
+    import pprint
+
+    return pprint.pformat(value, width=20, depth=2)
+
+
+def coroutine_wrapper(func, inner):
+    """
+    :param inner: checks the arguments and returns the coroutine of func
+    :return: a coroutine function, the coroutine of func is awaited directly
+    """
+
+    @wraps(func)
+    async def async_inner(*args, **kwargs):
+        return await inner(*args, **kwargs)
+
+    return async_inner
+
+
+def async_generator_wrapper(func, inner, check_item=None):
+    """
+    :param inner: checks the arguments and returns the async generator of func
+    :param check_item: will be called with every yielded item
+    :return: an async generator function which forwards everything to the async generator of func
+    """
+
+    @wraps(func)
+    async def async_inner(*args, **kwargs):
+        agen = inner(*args, **kwargs)
+        if not hasattr(agen, "asend"):
+            # the default of a Validator, an async generator can only return None
+            return
+        try:
+            item = await agen.__anext__()
+            while True:
+                if check_item is not None:
+                    check_item(item)
+                try:
+                    value = yield item
+                except GeneratorExit:
+                    await agen.aclose()
+                    raise
+                except BaseException as exc:
+                    item = await agen.athrow(exc)
+                else:
+                    item = await agen.asend(value)
+        except StopAsyncIteration:
+            return
+
+    return async_inner
+
+
+def lazy_wrapper(func, decorate):
+    """
+    :param decorate: returns the checking function of func, it is called once with the first call
+    :return: a function which decorates func with its first call, thread safe
+    """
+    import inspect
+    import threading
+
+    lock = threading.Lock()
+
+    def initialize():
+        nonlocal decorated
+        with lock:
+            # another thread could have decorated it while we were waiting
+            if decorated is first_call:
+                checking = decorate(func)
+                for attr in ("checker_plan", "stats"):
+                    if hasattr(checking, attr):
+                        setattr(lazy_inner, attr, getattr(checking, attr))
+                decorated = checking
+        return decorated
+
+    def first_call(*args, **kwargs):
+        return initialize()(*args, **kwargs)
+
+    decorated = first_call
+
+    def call(*args, **kwargs):
+        return decorated(*args, **kwargs)
+
+    if inspect.iscoroutinefunction(func):
+        lazy_inner = coroutine_wrapper(func, call)
+    elif inspect.isasyncgenfunction(func):
+        lazy_inner = async_generator_wrapper(func, call)
+    else:
+        lazy_inner = wraps(func)(call)
+    lazy_inner.__fe_strng_mtch__ = 0
+    return lazy_inner
+
+
 def match_typing(
     _func=None,
     *,
     excep_raise: Type[Exception] = TypeMisMatch,
-    subclass: bool = False,
+    subclass: Optional[bool] = False,
     severity="env",
     **kwargs,
 ):
     cached_enabled: int = kwargs.get("cache_size", 1)
-    cached_set = CachedSet(cached_enabled) if cached_enabled > 0 else None
+    cache_identity = kwargs.get("cache_identity", False)
+    cache_ttl = kwargs.get("cache_ttl")
     check_duck_typing = kwargs.get("allow_duck_typing", False)
+    codegen = kwargs.get("codegen", False)
+    sample_rate = kwargs.get("sample_rate", "env")
+    collect_stats = kwargs.get("stats", "env")
+    container_check = kwargs.get("container_check", "full")
+    sample_size = kwargs.get("sample_size", 10)
+    lazy = kwargs.get("lazy", "env")
+    if container_check not in CONTAINER_CHECKS:
+        raise ValueError(f"container_check must be one of {CONTAINER_CHECKS}")
+    if sample_rate != "env":
+        # raises the ValueError already here and not with the first call of a lazy function
+        _sample_rate(sample_rate)
+    plan_kwargs = {
+        "check_duck_typing": check_duck_typing,
+        "wrap_iterators": kwargs.get("wrap_iterators", False),
+        "check_return": kwargs.get("check_return", False),
+    }
+    if container_check != "full":
+        plan_kwargs.update(container_check=container_check, sample_size=sample_size)
 
     def wrapper(func):
         # needed in py 3.10
         # globals().update(func.__globals__)
+        if _is_stripped(severity):
+            return func
+        if _lazy_enabled(lazy):
+            return lazy_wrapper(func, decorate)
+        return decorate(func)
+
+    def decorate(func):
+        # with "env" the level can be changed while the program runs
+        current = settings if severity == "env" else FixedSeverity(_severity_level(severity))
+        # enum attribute lookups are too slow for every call
+        disabled = SEVERITY_LEVEL.DISABLED.value
+        enabled = SEVERITY_LEVEL.ENABLED.value
+
+        # imported with the first decoration and not already with strongtyping
+        import inspect
 
         arg_names = [name for name in inspect.signature(func).parameters]
+        # None: the first argument is removed if the function has no `self`, e.g. staticmethods
+        has_subclass = "self" not in arg_names if subclass is None else subclass
         annotations = func.__annotations__
-        severity_level = _severity_level(severity)
+        is_sampled = call_sampler(sample_rate)
+        is_coroutine = inspect.iscoroutinefunction(func)
+        is_async_generator = inspect.isasyncgenfunction(func)
+        func_plan_kwargs = plan_kwargs
+        yield_checker = None
+        if is_async_generator and plan_kwargs["check_return"]:
+            # the items of an async generator will be checked instead of the return value
+            func_plan_kwargs = dict(plan_kwargs, check_return=False)
+            item_type = iterator_item_type(annotations.get("return"), ASYNC_ITERATOR_ORIGINS)
+            if item_type is not None:
+                yield_checker = compile_checker(item_type, check_duck_typing=check_duck_typing)
+        if codegen:
+            plan = CodegenCheckerPlan(arg_names, annotations, func.__name__, **func_plan_kwargs)
+        else:
+            plan = CheckerPlan(arg_names, annotations, **func_plan_kwargs)
+        check_arguments = plan.failed_params
+        # e.g. `def __init__(self)` of a class decorated with match_class_typing
+        has_checks = bool(plan.positional) or plan.returns is not None
+        has_iterators = bool(plan.iterators)
+        # the cache is only used where a hit skips more than a few isinstance calls
+        cache_arguments = (
+            cached_enabled > 0 and plan.worth_caching and func.__name__ not in IGNORE_FUNCS
+        )
+        cache_result = cached_enabled > 0 and plan.return_worth_caching
+        cached_set = (
+            CachedSet(cached_enabled, ttl=cache_ttl, accurate_size=True)
+            if cache_arguments or cache_result
+            else None
+        )
+        is_cached = cached_set.__contains__ if cached_set is not None else None
+        function_stats = register(func) if stats_enabled(collect_stats) else None
+        if function_stats is not None:
+            # the counting is only wrapped around when it is enabled
+            check_arguments = function_stats.time_checks(check_arguments, plan.count_checks)
+            if is_cached is not None:
+                is_cached = function_stats.count_cache_hits(is_cached)
+
+        def item_failed(name, item):
+            msg = (
+                f"Incorrect item of parameter: [{name}] "
+                f"`{format_value(item)}`\n\trequired: {annotations[name]}"
+            )
+            if excep_raise is not None and current.severity == enabled:
+                raise excep_raise(msg, (name,), {name: item}, annotations) from None
+            warnings.warn(msg, RuntimeWarning)
+
+        def check_yielded(item):
+            if not yield_checker(item):
+                msg = (
+                    f"Incorrect yielded value: `{format_value(item)}`"
+                    f"\n\trequired: {annotations['return']}"
+                )
+                if excep_raise is not None and current.severity == enabled:
+                    raise excep_raise(msg, ("return",), {"return": item}, annotations) from None
+                warnings.warn(msg, RuntimeWarning)
+
+        def check_result(result):
+            return_key = None
+            if cache_result:
+                return_key = plan.return_fingerprint(result, cache_identity)
+                if return_key is not None and is_cached(return_key):
+                    return result
+            try:
+                is_valid = plan.returns(result)
+            except DefaultReturn as default_return:
+                # a Validator with a default replaces an invalid return value
+                return default_return.value
+            if is_valid:
+                if return_key is not None:
+                    cached_set.add(return_key)
+                return result
+
+            msg = (
+                f"Incorrect return value: `{format_value(result)}`"
+                f"\n\trequired: {annotations['return']}"
+            )
+            if excep_raise is not None and current.severity == enabled:
+                raise excep_raise(msg, ("return",), {"return": result}, annotations) from None
+            warnings.warn(msg, RuntimeWarning)
+            return result
+
+        if plan.returns is None:
+            call = func
+        elif is_coroutine:
+
+            async def call(*args, **kwargs):
+                return check_result(await func(*args, **kwargs))
+
+        else:
+
+            def call(*args, **kwargs):
+                return check_result(func(*args, **kwargs))
+
+        if is_coroutine:
+
+            async def default_result(value):
+                return value
+
+        else:
+
+            def default_result(value):
+                return value
 
         @wraps(func)
         def inner(*args, **kwargs):
-            if arg_names and severity_level > SEVERITY_LEVEL.DISABLED.value:
-                args = remove_subclass(args, subclass)
-                if cached_set is not None and func.__name__ not in IGNORE_FUNCS:
-                    # check if func with args and kwargs was checked
-                    # once before with positive result
-                    cached_key = (func, args.__str__(), kwargs.__str__())
-                    if cached_key in cached_set:
-                        return func(*args, **kwargs)
+            level = current.severity
+            if has_checks and level > disabled and (is_sampled is None or is_sampled()):
+                if has_subclass:
+                    args = remove_subclass(args, has_subclass)
+                if has_iterators:
+                    args, kwargs = plan.wrap_iterators(args, kwargs, item_failed)
+                cached_key = None
+                if cache_arguments:
+                    # check if func was called once before with arguments of the same
+                    # structure and had a positive result
+                    cached_key = plan.fingerprint(args, kwargs, cache_identity)
+                    if cached_key is not None and is_cached(cached_key):
+                        return call(*args, **kwargs)
 
                 # Thanks to Ruud van der Ham who find a better
                 # and more stable solution for check_args
-                failed_params = tuple(
-                    arg_name
-                    for arg, arg_name in zip(args, arg_names)
-                    if not check_type(
-                        arg,
-                        annotations.get(arg_name),
-                        mro=False,
-                        check_duck_typing=check_duck_typing,
-                    )
-                )
-                failed_params += tuple(
-                    kwarg_name
-                    for kwarg_name, kwarg in kwargs.items()
-                    if not check_type(
-                        kwarg,
-                        annotations.get(kwarg_name),
-                        mro=False,
-                        check_duck_typing=check_duck_typing,
-                    )
-                )
-
-                if not default_return_queue.empty():
-                    return default_return_queue.queue.pop()
+                try:
+                    failed_params = check_arguments(args, kwargs)
+                except DefaultReturn as default_return:
+                    return default_result(default_return.value)
 
                 if failed_params:
                     annotated_values = {arg_name: arg for arg, arg_name in zip(args, arg_names)}
@@ -82,24 +313,36 @@ def match_typing(
                         annotated_values[kwarg_name] = kwarg
 
                     msg_list = "\nIncorrect parameter: ".join(
-                        f"[{name}] `{pprint.pformat(annotated_values[name], width=20, depth=2)}`"
+                        f"[{name}] `{format_value(annotated_values[name])}`"
                         f"\n\trequired: {annotations[name]}"
                         for name in failed_params
                     )
                     msg = f"Incorrect parameter: {msg_list}"
 
-                    if excep_raise is not None and severity_level == SEVERITY_LEVEL.ENABLED.value:
+                    if excep_raise is not None and level == enabled:
                         raise excep_raise(
                             msg, failed_params, annotated_values, annotations
                         ) from None
                     else:
                         warnings.warn(msg, RuntimeWarning)
 
-                if cached_set is not None and func.__name__ not in IGNORE_FUNCS:
+                if cached_key is not None and not failed_params:
                     cached_set.add(cached_key)
+                return call(*args, **kwargs)
             return func(*args, **kwargs)
 
+        if function_stats is not None:
+            inner = function_stats.count_calls(inner)
+        if is_coroutine:
+            inner = coroutine_wrapper(func, inner)
+        elif is_async_generator:
+            inner = async_generator_wrapper(
+                func, inner, check_yielded if yield_checker is not None else None
+            )
+        if function_stats is not None:
+            inner.stats = function_stats
         inner.__fe_strng_mtch__ = 0
+        inner.checker_plan = plan
         return inner
 
     if _func is not None:
@@ -139,10 +382,7 @@ class MatchTypedDict:
             return any(obj.__name__ == "TypedDict" for obj in self.cls.__orig_bases__)
 
     def create_error_msg(self, args: dict):
-        return (
-            f"Incorrect parameter: `{pprint.pformat(args, width=20, depth=2)}`"
-            f"\n\trequired: {self.__annotations__}"
-        )
+        return f"Incorrect parameter: `{format_value(args)}`\n\trequired: {self.__annotations__}"
 
     def __call__(self, *args, **kwargs):
         if self.is_typed_dict:
@@ -159,28 +399,38 @@ class MatchTypedDict:
 def match_class_typing(cls=None, **kwargs):
     excep_raise = kwargs.pop("excep_raise", TypeMisMatch)
     cache_size = kwargs.pop("cache_size", 1)
+    cache_identity = kwargs.pop("cache_identity", False)
+    cache_ttl = kwargs.pop("cache_ttl", None)
     severity = kwargs.pop("severity", "env")
+    codegen = kwargs.pop("codegen", False)
+    container_check = kwargs.pop("container_check", "full")
+    sample_size = kwargs.pop("sample_size", 10)
+    sample_rate = kwargs.pop("sample_rate", "env")
+    stats = kwargs.pop("stats", "env")
+    wrap_iterators = kwargs.pop("wrap_iterators", False)
+    check_return = kwargs.pop("check_return", False)
+    lazy = kwargs.pop("lazy", "env")
 
     def __has_annotations__(obj):
         return hasattr(obj, "__annotations__")
 
     def __find_methods(_cls):
+        methods = ((name, getattr(_cls, name)) for name in dir(_cls))
         return [
-            func
-            for func in dir(_cls)
-            if callable(getattr(_cls, func))
-            and __has_annotations__(getattr(_cls, func))
-            and not hasattr(getattr(_cls, func), "__fe_strng_mtch__")
-            and not isinstance(getattr(_cls, func), classmethod)
+            (name, func)
+            for name, func in methods
+            if callable(func)
+            and __has_annotations__(func)
+            and not hasattr(func, "__fe_strng_mtch__")
+            and not isinstance(func, classmethod)
         ]
 
     def __add_decorator(_cls):
         severity_level = _severity_level(severity)
-        if severity_level > SEVERITY_LEVEL.DISABLED.value:
-            for method in __find_methods(_cls):
+        # with "env" the checks can be enabled later on
+        if severity == "env" or severity_level > SEVERITY_LEVEL.DISABLED.value:
+            for method, func in __find_methods(_cls):
                 try:
-                    func = getattr(_cls, method)
-                    is_static = "self" not in inspect.signature(func).parameters
                     setattr(
                         _cls,
                         method,
@@ -188,30 +438,39 @@ def match_class_typing(cls=None, **kwargs):
                             func,
                             severity=severity,
                             cache_size=cache_size,
+                            cache_identity=cache_identity,
+                            cache_ttl=cache_ttl,
                             excep_raise=excep_raise,
-                            subclass=is_static,
+                            subclass=None,
+                            codegen=codegen,
+                            container_check=container_check,
+                            sample_size=sample_size,
+                            sample_rate=sample_rate,
+                            stats=stats,
+                            wrap_iterators=wrap_iterators,
+                            check_return=check_return,
+                            lazy=lazy,
                         ),
                     )
                 except TypeError:
                     pass
 
     def wrapper(some_cls):
-        def inner(*args, **cls_kwargs):
-            __add_decorator(some_cls)
-            return some_cls(*args, **cls_kwargs)
-
-        inner._matches_class = True
-        return inner
-
-    if cls is not None:
+        if _is_stripped(severity):
+            return some_cls
+        # the methods are decorated only once, so creating an instance costs the same
+        # as creating an instance of the undecorated class
         if sys.version_info.major >= 3 and sys.version_info.minor > 7:
             from typing import _TypedDictMeta
 
-            if isinstance(cls, _TypedDictMeta):
-                return MatchTypedDict(cls)
-        __add_decorator(cls)
-        cls._matches_class = True
-        return cls
+            if isinstance(some_cls, _TypedDictMeta):
+                return MatchTypedDict(some_cls, excep_raise=excep_raise, severity=severity)
+        __add_decorator(some_cls)
+        some_cls._matches_class = True
+        return some_cls
+
+    if cls is not None:
+        return wrapper(cls)
     else:
         return wrapper
 
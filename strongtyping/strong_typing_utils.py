@@ -1,12 +1,13 @@
-import inspect
+import array
 import os
 import sys
 import typing
-from functools import lru_cache, partial
-from queue import Queue
-from typing import Any, TypeVar  # type: ignore
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, TypeVar  # type: ignore
 
 from strongtyping._utils import ORIGINAL_DUCK_TYPES, install_st_m
+from strongtyping.numpy_typing import NDArrayType, ndarray_items_match
 
 install_st_m()
 
@@ -21,7 +22,18 @@ else:
     extension_module = bool(int(os.environ["ST_MODULES_INSTALLED"]))
 
 empty = object()
-default_return_queue = Queue()
+
+CONTAINER_CHECKS = ("full", "first", "sample")
+
+# the class of the items of a memoryview or an array.array by its format
+BUFFER_ITEM_TYPES = {
+    **dict.fromkeys("bBhHiIlLqQnNP", int),
+    **dict.fromkeys("efd", float),
+    "?": bool,
+    "c": bytes,
+    "u": str,
+    "w": str,
+}
 
 
 class TypeMisMatch(AttributeError):
@@ -41,6 +53,17 @@ class ValidationError(Exception):
         message = message
 
 
+class DefaultReturn(Exception):
+    """
+    raised by a Validator with a default when the argument did not pass the validation,
+    the decorated function returns `value` without being called
+    """
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.value = value
+
+
 py_version = sys.version_info.minor
 if hasattr(typing, "_GenericAlias"):
     typing_base_class = typing._GenericAlias  # type: ignore
@@ -48,7 +71,10 @@ else:
     typing_base_class = typing.GenericMeta  # type: ignore
 
 
-@lru_cache(maxsize=1024)
+# annotations are defined once in the code, so this cache grows with the code and not the calls
+_possible_types: Dict[tuple, typing.Union[tuple, None]] = {}
+
+
 def get_possible_types(typ_to_check, origin_name: str = "") -> typing.Union[tuple, None]:
     """
     :param typ_to_check:
@@ -59,6 +85,18 @@ def get_possible_types(typ_to_check, origin_name: str = "") -> typing.Union[tupl
         - Dict[str, int] = (str, int, )
         - Tuple[Union[str, int], List[int]] = (Union[str, int], List[int], )
     """
+    key = (typ_to_check, origin_name)
+    try:
+        return _possible_types[key]
+    except KeyError:
+        possible_types = _possible_types[key] = _get_possible_types(typ_to_check, origin_name)
+        return possible_types
+    except TypeError:
+        # unhashable annotation
+        return _get_possible_types(typ_to_check, origin_name)
+
+
+def _get_possible_types(typ_to_check, origin_name: str = "") -> typing.Union[tuple, None]:
     if origin_name == "typeddict":
         # we can ensure now that we use a python version which has typing.TypedDict
         return typ_to_check
@@ -114,36 +152,79 @@ def get_origins(typ_to_check: Any) -> tuple:
             origin_name = typ_to_check._name
         else:
             origin_name = str(origin).replace("typing.", "")
+    if origin_name is None and isinstance(origin, str):
+        # since python 3.10 special forms have a __name__ but their aliases no _name
+        origin_name = origin
     return origin, origin_name
 
 
-def checking_typing_dict(arg: Any, possible_types: tuple, *args):
+def get_elements(arg: Any, container_check: str = None, sample_size: int = None, **kwargs):
+    """
+    :param arg: the container which will be checked
+    :param container_check:
+        - full: all elements (default)
+        - first: the first `sample_size` elements
+        - sample: the first, the last and `sample_size` random elements, for containers which
+            are not a list or tuple this is the same as first
+    :param sample_size: number of elements which will be checked
+    :return: the elements of `arg` which needs to be checked
+    """
+    if container_check is None or container_check == "full":
+        return arg
+    if sample_size is None:
+        sample_size = 10
+    if container_check == "sample" and isinstance(arg, (list, tuple)):
+        if len(arg) <= sample_size + 2:
+            return arg
+        from random import sample
+
+        indices = sample(range(1, len(arg) - 1), sample_size)
+        return [arg[0], arg[-1], *(arg[index] for index in indices)]
+    return list(islice(arg, sample_size))
+
+
+def is_known_valid(arg: Any, possible_types: tuple) -> bool:
+    """
+    :return: True if arg is a TypedList, TypedMapping or TypedSet of these types,
+        they check their items with every change
+    """
+    return getattr(arg, "known_valid", False) and arg.item_types == possible_types
+
+
+def checking_typing_dict(arg: Any, possible_types: tuple, *args, **kwargs):
     if not isinstance(arg, dict):
         return False
     if isinstance(arg, dict) and not possible_types:
         return True
+    if is_known_valid(arg, possible_types):
+        return True
     try:
         key, val = possible_types
     except (ValueError, TypeError):
         return isinstance(arg, dict)
     else:
+        kwargs.pop("validation_with", None)
+        keys = get_elements(arg.keys(), **kwargs)
+        values = [arg[k] for k in keys] if isinstance(keys, list) else arg.values()
         try:
-            result_key = all(check_type(a, key) for a in arg.keys())
+            result_key = all(check_type(a, key, **kwargs) for a in keys)
         except AttributeError:
-            result_key = all(isinstance(k, key) for k in arg.keys())
+            result_key = all(isinstance(k, key) for k in keys)
         try:
-            result_val = all(check_type(a, val) for a in arg.values())
+            result_val = all(check_type(a, val, **kwargs) for a in values)
         except AttributeError:
-            result_val = all(isinstance(v, val) for v in arg.values())
+            result_val = all(isinstance(v, val) for v in values)
         return result_key and result_val
 
 
 def checking_typing_set(arg: Any, possible_types: tuple, *args, **kwargs):
     if not possible_types:
         return isinstance(arg, set)
+    if is_known_valid(arg, possible_types):
+        return True
     possible_type = possible_types[0]
     return isinstance(arg, set) and all(
-        check_type(argument, possible_type, **kwargs) for argument in arg
+        check_type(argument, possible_type, **kwargs) for argument in get_elements(arg, **kwargs)
     )
 
 
@@ -188,7 +269,9 @@ def checking_typing_callable(arg: Any, possible_types: tuple, *args, **kwargs):
         else:
             return parameter_type == required_parameter_type
 
-    insp = inspect.signature(arg)
+    from inspect import signature
+
+    insp = signature(arg)
     *required_params, return_val = possible_types
     _, return_name = get_origins(return_val)
     if return_name.lower() == "any":
@@ -219,14 +302,20 @@ def checking_typing_list(arg: Any, possible_types: tuple, *args, **kwargs):
         return False
     if isinstance(arg, list) and not possible_types:
         return True
+    if is_known_valid(arg, possible_types):
+        return True
     possible_type = possible_types[0]
-    return all(check_type(argument, possible_type, **kwargs) for argument in arg)
+    return all(
+        check_type(argument, possible_type, **kwargs) for argument in get_elements(arg, **kwargs)
+    )
 
 
 def checking_ellipsis(arg, possible_types, *args, **kwargs):
     possible_types = [pt for pt in possible_types if pt is not Ellipsis]
     possible_type = possible_types[0]
-    return all(check_type(argument, possible_type, **kwargs) for argument in arg)
+    return all(
+        check_type(argument, possible_type, **kwargs) for argument in get_elements(arg, **kwargs)
+    )
 
 
 def checking_typing_json(arg, possible_types, *args, **kwargs):
@@ -253,6 +342,15 @@ def checking_typing__validator(arg, possible_types, *args, **kwargs):
     return checking_typing_validator(arg, possible_types, *args, **kwargs)
 
 
+def validation_source(validation: Callable) -> tuple:
+    """
+    :return: the file and the line of the validation function, only needed for the error message
+    """
+    import inspect
+
+    return inspect.getfile(validation), inspect.getsourcelines(validation)[1]
+
+
 def checking_typing_validator(arg, possible_types, *args, **kwargs):
     if len(possible_types) == 2:
         default_return = empty
@@ -261,12 +359,11 @@ def checking_typing_validator(arg, possible_types, *args, **kwargs):
         required_type, validation, default_return = possible_types
     if validation(arg) is False:
         if default_return is not empty:
-            default_return_queue.put(default_return)
-            return None
+            # raised instead of stored globally so that it only belongs to the current call
+            raise DefaultReturn(default_return)
         if isinstance(validation, partial):
             validation = validation.func
-        validation_function_file = inspect.getfile(validation)
-        validation_body, validation_line = inspect.getsourcelines(validation)
+        validation_function_file, validation_line = validation_source(validation)
         raise ValidationError(
             f"Argument: `{arg}` did not pass the validation defined here "
             f'\n\tFile: "{validation_function_file}", line {validation_line}'
@@ -291,11 +388,51 @@ def checking_typing_itervalidator(arg, possible_types, *args, **kwargs):
     return check_type(arg, required_type, validation_with=validation, **kwargs)
 
 
+def buffer_item_type(arg: Any) -> Optional[type]:
+    """
+    :return: the class of all items of bytes, bytearray, memoryview and array.array
+        decided by the buffer format, None for all other objects
+    """
+    if isinstance(arg, (bytes, bytearray)):
+        return int
+    if isinstance(arg, array.array):
+        return BUFFER_ITEM_TYPES.get(arg.typecode)
+    if isinstance(arg, memoryview):
+        try:
+            if arg.ndim != 1:
+                return None
+            # without the byte order
+            return BUFFER_ITEM_TYPES.get(arg.format.lstrip("@=<>!"))
+        except ValueError:
+            # released memoryview
+            return None
+    return None
+
+
+def items_match_by_type(arg: Any, item_type) -> Optional[bool]:
+    """
+    decides without iterating whether all items of a buffer or a numpy array are of item_type
+
+    :param item_type: a class or a tuple of classes
+    :return: None if the items need to be checked one by one
+    """
+    buffer_type = buffer_item_type(arg)
+    if buffer_type is not None:
+        return issubclass(buffer_type, item_type)
+    return ndarray_items_match(arg, item_type)
+
+
 def checking_typing_iterable(arg: Any, possible_types: tuple, *args, **kwargs):
     if not hasattr(arg, "__iter__"):
         return False
     pssble_type = possible_types[0]
-    return all(check_type(argument, pssble_type, **kwargs) for argument in arg)
+    if isinstance(pssble_type, type):
+        items_match = items_match_by_type(arg, pssble_type)
+        if items_match is not None:
+            return items_match
+    return all(
+        check_type(argument, pssble_type, **kwargs) for argument in get_elements(arg, **kwargs)
+    )
 
 
 def checking_typing_typedict_values(args: dict, required_types: dict, total: bool):
@@ -366,8 +503,7 @@ def module_checking_typing_validator(arg, possible_types, *args, **kwargs):
     if validation(arg) is False:
         if isinstance(validation, partial):
             validation = validation.func
-        validation_function_file = inspect.getfile(validation)
-        validation_body, validation_line = inspect.getsourcelines(validation)
+        validation_function_file, validation_line = validation_source(validation)
         raise ValidationError(
             f"Argument: `{arg}` did not pass the validation defined here "
             f'\n\tFile: "{validation_function_file}", line {validation_line}'
@@ -398,6 +534,56 @@ def check_duck_typing(arg, possible_types, *args, **kwargs):
     return arg_mros.issuperset(required_mros)
 
 
+# user defined checkers by the class or the origin of an annotation
+registered_checkers: Dict[Any, Callable[[Any, Any], bool]] = {}
+
+
+def register_checker(origin, checker: Optional[Callable[[Any, Any], bool]] = None):
+    """
+    registers a checker for a class or a generic class, e.g. `MyModel` or `Table` for `Table[int]`,
+    register it before the functions are decorated
+
+    :param origin: the annotation itself or its __origin__
+    :param checker: will be called with the argument and the annotation,
+        returns True if the argument matches, can also be used as decorator
+    """
+    if checker is None:
+        return partial(register_checker, origin)
+    registered_checkers[origin] = checker
+    _clear_interned_checkers()
+    return checker
+
+
+def unregister_checker(origin):
+    registered_checkers.pop(origin, None)
+    _clear_interned_checkers()
+
+
+def _clear_interned_checkers():
+    # the compiled checkers of the annotations could depend on the registered checkers
+    from strongtyping.checker_plan import clear_checker_cache
+
+    clear_checker_cache()
+
+
+def get_registered_checker(type_of) -> Optional[Callable[[Any, Any], bool]]:
+    """
+    :return: the checker registered for type_of or its origin, None if there is none
+    """
+    if not registered_checkers:
+        return None
+    try:
+        checker = registered_checkers.get(type_of)
+    except TypeError:
+        # unhashable annotation
+        return None
+    if checker is None:
+        origin = getattr(type_of, "__origin__", None)
+        if origin is not None:
+            checker = registered_checkers.get(origin)
+    return checker
+
+
 supported_typings = vars()
 if extension_module:
     m = [f"module_checking_typing_{t}" for t in ("list", "dict", "set", "tuple", "validator")]
@@ -413,7 +599,13 @@ def check_type(argument, type_of, mro=False, **kwargs):
         # generator will be exhausted when we check it, so we return it without any checking
         return argument
 
+    checker = get_registered_checker(type_of)
+    if checker is not None:
+        return checker(argument, type_of)
+
     check_result = True
+    if isinstance(type_of, NDArrayType):
+        return isinstance(argument, type_of)
     if type_of is not None:
         origin, origin_name = get_origins(type_of)
         origin_name = origin_name.lower()
@@ -456,7 +648,8 @@ def check_type(argument, type_of, mro=False, **kwargs):
             return type_of in argument
         else:
             try:
-                is_instance = isinstance(argument, type_of) or argument == type_of
+                # `is True` because numpy arrays compare elementwise
+                is_instance = isinstance(argument, type_of) or (argument == type_of) is True
             except TypeError:
                 return isinstance(argument, type_of._subs_tree()[1:])
             else:
@@ -4,10 +4,15 @@
 @created: 12.07.20
 @author: felix
 """
+import threading
+import time
+from typing import List, Union
+
 import pytest
 
 from strongtyping.cached_dict import CachedDict
 from strongtyping.cached_set import CachedSet
+from strongtyping.strong_typing import match_typing
 
 
 @pytest.mark.parametrize("cls", [CachedDict, CachedSet])
@@ -24,3 +29,114 @@ def test_max_size(cls):
 
     assert _add(memory_limit=0.0001) == 1
     assert _add(memory_limit=1, max_items=1000) == 1000
+
+
+def test_cached_dict_removes_least_recently_used():
+    cached_dict = CachedDict(max_items=3)
+    for i in range(3):
+        cached_dict[i] = i
+
+    assert cached_dict[0] == 0
+    cached_dict[3] = 3
+
+    assert list(cached_dict) == [2, 0, 3]
+
+
+def test_cached_set_removes_least_recently_used():
+    cached_set = CachedSet(max_items=2)
+    cached_set.add("a")
+    cached_set.add("b")
+
+    assert "a" in cached_set
+    cached_set.add("c")
+
+    assert set(cached_set) == {"a", "c"}
+
+
+@pytest.mark.parametrize("cls", [CachedDict, CachedSet])
+def test_accurate_size_includes_elements(cls):
+    cached = cls(memory_limit=0.01, accurate_size=True)
+    for i in range(100):
+        val = "helloworld" * 100 + str(i)
+        try:
+            cached[val] = None
+        except TypeError:
+            cached.add(val)
+
+    assert cached.memory_usage <= 10000
+    assert 0 < len(cached) < 10
+
+
+def test_ttl_expires_items():
+    cached_dict = CachedDict(ttl=0.01)
+    cached_dict["a"] = 1
+    assert "a" in cached_dict
+
+    time.sleep(0.02)
+    assert "a" not in cached_dict
+    assert cached_dict.get("a") is None
+    assert len(cached_dict) == 0
+
+
+def run_in_threads(target, number: int = 8) -> list:
+    """
+    :return: the exceptions raised in the threads
+    """
+    errors = []
+    barrier = threading.Barrier(number)
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(number)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_cached_set_from_many_threads():
+    cached_set = CachedSet(max_items=16, ttl=60)
+
+    def use_cache(index):
+        for value in range(20000):
+            element = (index, value % 64)
+            if element not in cached_set:
+                cached_set.add(element)
+            cached_set.discard((index, value % 7))
+
+    assert run_in_threads(use_cache) == []
+    assert len(cached_set) <= 16
+
+
+def test_cached_dict_items_from_many_threads():
+    cached_dict = CachedDict(max_items=16)
+
+    def use_cache(index):
+        for value in range(5000):
+            if index % 2:
+                cached_dict[value % 64] = value
+                cached_dict.touch((value + 1) % 64)
+            else:
+                for key, val in cached_dict.items():
+                    assert val % 64 == key
+                assert len(cached_dict.values()) <= 16
+
+    assert run_in_threads(use_cache) == []
+
+
+def test_match_typing_cache_from_many_threads():
+    @match_typing(cache_size=0.001)
+    def func_a(a: Union[int, List[int]]):
+        return a
+
+    def call(index):
+        for value in range(5000):
+            assert func_a(value) == value
+
+    assert run_in_threads(call) == []
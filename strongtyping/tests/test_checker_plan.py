@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import pytest
+
+from strongtyping.checker_plan import (
+    PASS_CHECKER,
+    CheckerPlan,
+    CodegenCheckerPlan,
+    DictChecker,
+    FallbackChecker,
+    InstanceChecker,
+    ListChecker,
+    TupleChecker,
+    UnionChecker,
+    checker_cache_info,
+    checker_stats,
+    clear_checker_cache,
+    compile_checker,
+)
+from strongtyping.strong_typing import match_typing
+from strongtyping.strong_typing_utils import TypeMisMatch
+
+
+def test_compile_checker_resolves_the_checker_once():
+    assert compile_checker(None) is PASS_CHECKER
+    assert isinstance(compile_checker(int), InstanceChecker)
+    assert isinstance(compile_checker(List[int]), ListChecker)
+    assert isinstance(compile_checker(Dict[str, int]), DictChecker)
+    assert isinstance(compile_checker(Tuple[str, int]), TupleChecker)
+    assert isinstance(compile_checker(Union[int, List[int]]), UnionChecker)
+    # unions of plain classes are a single isinstance check
+    assert isinstance(compile_checker(Optional[int]), InstanceChecker)
+
+
+@pytest.mark.parametrize(
+    "annotation, valid, invalid",
+    [
+        (int, 1, "1"),
+        (List[int], [1, 2, 3], [1, "2", 3]),
+        (List[Union[int, str]], [1, "2"], [1, 2.0]),
+        (Set[str], {"a", "b"}, {"a", 1}),
+        (Dict[str, List[int]], {"a": [1]}, {"a": ["1"]}),
+        (Tuple[int, str], (1, "a"), (1, "a", 2)),
+        (Tuple[int, ...], (1, 2, 3), (1, "2")),
+        (Optional[List[int]], None, ["1"]),
+        (Iterable[int], range(3), ["1"]),
+        (Any, object(), None),
+    ],
+)
+def test_compiled_checker_matches_check_type(annotation, valid, invalid):
+    checker = compile_checker(annotation)
+    assert checker(valid)
+    if invalid is not None:
+        assert not checker(invalid)
+
+
+def test_compiled_checker_does_not_exhaust_generators():
+    checker = compile_checker(Iterable[int])
+    values = (i for i in range(3))
+
+    assert checker(values)
+    assert list(values) == [0, 1, 2]
+
+
+def test_unknown_annotations_use_fallback():
+    from typing import Callable
+
+    assert isinstance(compile_checker(Callable[[], int]), FallbackChecker)
+
+
+def test_checker_plan_skips_parameters_without_annotation():
+    plan = CheckerPlan(["a", "b", "c"], {"b": int, "c": List[str]})
+
+    assert [name for _, name, _ in plan.positional] == ["b", "c"]
+    assert plan.failed_params((1, 2, ["3"]), {}) == ()
+    assert plan.failed_params((1, "2"), {"c": [3]}) == ("b", "c")
+
+
+def test_match_typing_exposes_checker_plan():
+    @match_typing
+    def func_a(a: int, b: List[str]):
+        return True
+
+    assert isinstance(func_a.checker_plan, CheckerPlan)
+    assert func_a(1, ["2"])
+
+    with pytest.raises(TypeMisMatch):
+        func_a(1, [2])
+
+
+def test_codegen_plan_generates_inlined_checks():
+    plan = CodegenCheckerPlan(["a", "b"], {"a": int, "b": List[str]}, "func_a")
+
+    assert plan.source.startswith("def check_func_a(args, kwargs):")
+    assert "isinstance(_a0, " in plan.source
+    assert "type(_a1) is list and all(" in plan.source
+    assert plan.failed_params((1, ["2"]), {}) == ()
+    assert plan.failed_params(("1", [2]), {}) == ("a", "b")
+    assert plan.failed_params((1,), {"b": [2]}) == ("b",)
+
+
+@pytest.mark.parametrize(
+    "annotation, valid, invalid",
+    [
+        (Dict[str, Tuple[int, Optional[str]]], {"a": (1, None)}, {"a": (1, 2)}),
+        (Union[int, List[int]], [1, 2], ["1"]),
+        (Set[str], {"a"}, {1}),
+        (Tuple[int, ...], (1, 2), (1, "2")),
+        (Iterable[int], [1, 2], ["1"]),
+    ],
+)
+def test_codegen_plan_matches_checker_plan(annotation, valid, invalid):
+    plan = CheckerPlan(["a"], {"a": annotation})
+    codegen_plan = CodegenCheckerPlan(["a"], {"a": annotation})
+
+    assert plan.failed_params((valid,), {}) == codegen_plan.failed_params((valid,), {}) == ()
+    assert plan.failed_params((invalid,), {}) == codegen_plan.failed_params((invalid,), {})
+    assert codegen_plan.failed_params((invalid,), {}) == ("a",)
+
+
+def test_match_typing_with_codegen():
+    @match_typing(codegen=True)
+    def func_a(a: int, b: List[str] = None):
+        return True
+
+    assert isinstance(func_a.checker_plan, CodegenCheckerPlan)
+    assert func_a(1, ["2"])
+    assert func_a(1, b=["2"])
+
+    with pytest.raises(TypeMisMatch):
+        func_a(1, b=[2])
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_match_typing_first_container_check(codegen):
+    @match_typing(container_check="first", sample_size=3, codegen=codegen)
+    def func_a(a: List[int], b: Dict[str, int] = None, c: Set[int] = None):
+        return True
+
+    assert func_a([1, 2, 3, "4"])
+    assert func_a([1, 2, 3], b={"a": 1, "b": 2, "c": 3, "d": "4"})
+
+    with pytest.raises(TypeMisMatch):
+        func_a([1, "2", 3, 4])
+
+    with pytest.raises(TypeMisMatch):
+        func_a([1], b={"a": "1"})
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_match_typing_sample_container_check(codegen):
+    @match_typing(container_check="sample", sample_size=2, codegen=codegen)
+    def func_a(a: List[int], b: Tuple[int, ...] = ()):
+        return True
+
+    values = list(range(1000))
+    assert func_a(values)
+
+    # the first and the last element will always be checked
+    with pytest.raises(TypeMisMatch):
+        func_a(["0"] + values)
+
+    with pytest.raises(TypeMisMatch):
+        func_a([], b=tuple(values) + ("1000",))
+
+    # containers which are not larger than the sample will be checked completely
+    with pytest.raises(TypeMisMatch):
+        func_a([1, "2", 3, 4])
+
+
+def test_container_check_for_nested_containers():
+    checker = compile_checker(List[List[int]], container_check="first", sample_size=1)
+
+    assert checker([[1, "2"], ["3"]])
+    assert not checker([["1"], [2]])
+
+
+def test_match_typing_unknown_container_check():
+    with pytest.raises(ValueError):
+        match_typing(container_check="some")
+
+
+def test_equal_annotations_share_one_checker():
+    @match_typing
+    def func_a(a: Dict[str, List[int]]):
+        return a
+
+    @match_typing
+    def func_b(b: Dict[str, List[int]], c: List[int]):
+        return b
+
+    checker = compile_checker(Dict[str, List[int]])
+    assert checker is compile_checker(Dict[str, List[int]])
+    # nested annotations are shared as well
+    assert checker.value is compile_checker(List[int])
+    # other options result in another checker
+    assert compile_checker(List[int], container_check="first") is not compile_checker(List[int])
+    # unhashable options are compiled every time
+    assert compile_checker(List[int], unhashable=[]) is not compile_checker(List[int])
+
+    clear_checker_cache()
+    assert checker_cache_info() == {"checkers": 0, "hits": 0, "misses": 0}
+    assert compile_checker(List[int]) is compile_checker(List[int])
+    # List[int] and int
+    assert checker_cache_info() == {"checkers": 2, "hits": 1, "misses": 2}
+    # already compiled checkers stay valid
+    assert func_a({"a": [1]}) and func_b({"a": [1]}, [1])
+    with pytest.raises(TypeMisMatch):
+        func_b({"a": ["1"]}, [1])
+
+
+def test_shared_checkers_share_their_stats():
+    from strongtyping.stats import reset_stats
+
+    @match_typing(stats=True, cache_size=0)
+    def func_a(a: Dict[str, List[float]]):
+        return a
+
+    @match_typing(stats=True, cache_size=0)
+    def func_b(b: Dict[str, List[float]], c: int = 1):
+        return b
+
+    checker = compile_checker(Dict[str, List[float]])
+    reset_stats()
+    func_a({"a": [1.0]})
+    func_b(b={"a": [1.0]})
+    with pytest.raises(TypeMisMatch):
+        func_b({"a": ["1"]}, 2)
+
+    assert checker.checks == 3
+    assert checker.failures == 1
+    assert {"checker": repr(checker), "checks": 3, "failures": 1} in checker_stats()
+
+    reset_stats()
+    assert checker.checks == checker.failures == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pytest
+
+from strongtyping.code_cache import CACHE_TAG, compile_cached, load_code
+from strongtyping.config import set_cache_dir
+from strongtyping.strong_typing import match_typing
+from strongtyping.strong_typing_utils import TypeMisMatch
+
+
+def cached_files(directory) -> list:
+    path = directory / CACHE_TAG
+    return sorted(os.listdir(path)) if path.exists() else []
+
+
+def test_no_cache_without_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv("ST_CACHE_DIR", "")
+    compile_cached("a = 1\n", "<test>")
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_generated_code_is_cached(monkeypatch, tmp_path):
+    # restores the environment afterwards
+    monkeypatch.setenv("ST_CACHE_DIR", "")
+    set_cache_dir(str(tmp_path))
+
+    def decorate():
+        @match_typing(codegen=True)
+        def func_a(a: int, b: List[Dict[str, int]]):
+            return a
+
+        return func_a
+
+    func_a = decorate()
+    files = cached_files(tmp_path)
+    assert len(files) == 1
+    modified = os.stat(tmp_path / CACHE_TAG / files[0]).st_mtime_ns
+
+    # a new decoration, e.g. in the next process, loads the cached code
+    func_b = decorate()
+    assert cached_files(tmp_path) == files
+    assert os.stat(tmp_path / CACHE_TAG / files[0]).st_mtime_ns == modified
+    assert func_b(1, [{"a": 1}]) == 1
+    with pytest.raises(TypeMisMatch):
+        func_b(1, [{"a": "1"}])
+    assert func_a.checker_plan.failed_params.__code__ == func_b.checker_plan.failed_params.__code__
+
+
+def test_other_annotations_are_cached_separately(monkeypatch, tmp_path):
+    monkeypatch.setenv("ST_CACHE_DIR", str(tmp_path))
+
+    @match_typing(codegen=True)
+    def func_a(a: int):
+        return a
+
+    @match_typing(codegen=True)
+    def func_b(a: str):
+        return a
+
+    assert len(cached_files(tmp_path)) == 2
+    assert func_a(1) == 1 and func_b("1") == "1"
+
+
+def test_broken_cache_files_are_replaced(monkeypatch, tmp_path):
+    monkeypatch.setenv("ST_CACHE_DIR", str(tmp_path))
+    source = "def func_a():\n    return 1\n"
+    compile_cached(source, "<test>")
+    (path,) = (tmp_path / CACHE_TAG).iterdir()
+
+    path.write_bytes(b"broken")
+    assert load_code(str(path)) is None
+    namespace = {}
+    exec(compile_cached(source, "<test>"), namespace)
+
+    assert namespace["func_a"]() == 1
+    assert load_code(str(path)) is not None
+
+
+def test_concurrent_writers(monkeypatch, tmp_path):
+    monkeypatch.setenv("ST_CACHE_DIR", str(tmp_path))
+    sources = [f"def func_a():\n    return {index % 4}\n" for index in range(64)]
+
+    with ThreadPoolExecutor(8) as executor:
+        codes = list(executor.map(lambda source: compile_cached(source, "<test>"), sources))
+
+    # no temporary files are left behind
+    assert len(cached_files(tmp_path)) == 4
+    for index, code in enumerate(codes):
+        namespace = {}
+        exec(code, namespace)
+        assert namespace["func_a"]() == index % 4
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
@@ -328,6 +328,51 @@ def test_with_docstring_custom_class():
         func_a(Other())
 
 
+def test_with_docstring_sample_rate():
+    @match_docstring(sample_rate=0.5)
+    def func_a(a):
+        """
+        :param a:
+        :type a: int
+        """
+        return a
+
+    assert func_a("1") == "1"
+    with pytest.raises(TypeMisMatch):
+        func_a("1")
+
+
+def test_docstring_types_are_compiled_once():
+    from strongtyping.docstring_typing import compile_doc_str_type
+
+    checker = compile_doc_str_type("list(int)")
+
+    assert checker is compile_doc_str_type("list(int)")
+    assert checker([1, 2])
+    assert not checker([1, "2"])
+    assert not checker(1)
+    assert compile_doc_str_type("int or float")(1.0)
+    assert compile_doc_str_type(None)(object())
+
+
+def test_with_docstring_wrong_container():
+    @match_docstring
+    def func_a(a, b):
+        """
+        :param a:
+        :type a: list(int)
+        :param b:
+        :type b: dict(str, int)
+        """
+        return a
+
+    with pytest.raises(TypeMisMatch):
+        func_a(1, {"a": 1})
+
+    with pytest.raises(TypeMisMatch):
+        func_a([1], b=[1])
+
+
 def test_exception_none():
     @match_docstring(excep_raise=None)
     def multipler(a, b):
@@ -374,6 +419,42 @@ def test_with_class_decorator():
         d._my_secure_func(d, 0.5)
 
 
+def test_with_class_decorator_wraps_methods_once():
+    @match_class_docstring
+    class Dummy:
+        def a(self, val: int):
+            """
+            :param int val: foo
+            """
+            return val
+
+        @staticmethod
+        def b(val: int):
+            """
+            :param int val: foo
+            """
+            return val
+
+        @classmethod
+        def c(cls, val: int):
+            """
+            :param int val: foo
+            """
+            return val
+
+    d = Dummy()
+    method_a = Dummy.a
+
+    assert isinstance(d, Dummy)
+    assert d.__dict__ == {}
+    assert Dummy().a(1) == d.b(1) == d.c(1) == 1
+    assert Dummy.a is method_a
+
+    for method in (d.a, d.b, d.c, Dummy.b, Dummy.c):
+        with pytest.raises(TypeError):
+            method("1")
+
+
 def test_with_class_decorator_no_execption():
     @match_class_docstring(excep_raise=None)
     class Dummy:
@@ -487,5 +568,26 @@ def test_with_severity_param():
     assert a("2") == "22"
 
 
+def test_with_strip_severity():
+    def func_a(a):
+        """
+        :param a: int
+        """
+        return a
+
+    class Dummy:
+        def __init__(self, a):
+            """
+            :param a: int
+            """
+            self.a = a
+
+    assert match_docstring(func_a, severity=SEVERITY_LEVEL.STRIP) is func_a
+    init = Dummy.__init__
+    assert match_class_docstring(Dummy, severity=SEVERITY_LEVEL.STRIP) is Dummy
+    assert Dummy.__init__ is init
+    assert "__new__" not in Dummy.__dict__
+
+
 if __name__ == "__main__":
     pytest.main(["-vv", "-s", __file__])
@@ -15,6 +15,7 @@ except ImportError:
 
 import pytest
 
+from strongtyping.config import settings
 from strongtyping.docs_from_typing import (
     class_docs_from_typing,
     numpy_docs_from_typing,
@@ -125,3 +126,24 @@ def test_docstring_on_whole_class():
     assert Foo.__doc__
     assert "val_a" in Foo.__doc__
     assert "val_b" in Foo.__doc__
+
+
+def test_docs_from_typing_with_strip_severity(monkeypatch):
+    # monkeypatch restores the settings like the environment
+    monkeypatch.setattr(settings, "severity", settings.severity)
+    monkeypatch.setenv("ST_SEVERITY", "strip")
+    settings.refresh()
+
+    def foo(val: int) -> int:
+        """some text"""
+        return val
+
+    class Dummy:
+        def __init__(self, val: int):
+            self.val = val
+
+    assert rest_docs_from_typing(foo) is foo
+    assert numpy_docs_from_typing(foo) is foo
+    assert foo.__doc__ == "some text"
+    assert class_docs_from_typing(Dummy) is Dummy
+    assert Dummy.__doc__ is None
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import asyncio
+import inspect
+import threading
+from typing import List
+
+import pytest
+
+from strongtyping.checker_plan import CheckerPlan
+from strongtyping.config import set_lazy
+from strongtyping.strong_typing import lazy_wrapper, match_class_typing, match_typing
+from strongtyping.strong_typing_utils import TypeMisMatch
+
+
+def test_lazy_match_typing():
+    @match_typing(lazy=True)
+    def func_a(a: int, b: List[str]):
+        return a
+
+    # nothing is compiled before the first call
+    assert not hasattr(func_a, "checker_plan")
+    assert func_a.__name__ == "func_a"
+    assert hasattr(func_a, "__fe_strng_mtch__")
+
+    assert func_a(1, ["1"]) == 1
+    assert isinstance(func_a.checker_plan, CheckerPlan)
+    with pytest.raises(TypeMisMatch):
+        func_a("1", ["1"])
+    with pytest.raises(TypeMisMatch):
+        func_a(1, [1])
+
+
+def test_lazy_with_env(monkeypatch):
+    monkeypatch.setenv("ST_LAZY", "0")
+    set_lazy(True)
+
+    @match_typing
+    def func_a(a: int):
+        return a
+
+    assert not hasattr(func_a, "checker_plan")
+    with pytest.raises(TypeMisMatch):
+        func_a("1")
+
+    @match_typing(lazy=False)
+    def func_b(a: int):
+        return a
+
+    assert hasattr(func_b, "checker_plan")
+
+
+def test_lazy_decoration_happens_once():
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def decorate(func):
+        calls.append(func)
+        return func
+
+    def func_a(a: int):
+        return a
+
+    lazy_func = lazy_wrapper(func_a, decorate)
+
+    def first_call(value):
+        barrier.wait()
+        return lazy_func(value)
+
+    threads = [threading.Thread(target=first_call, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [func_a]
+    assert lazy_func(1) == 1
+    assert calls == [func_a]
+
+
+def test_lazy_async_functions():
+    @match_typing(lazy=True)
+    async def func_a(a: int):
+        return a
+
+    @match_typing(lazy=True, check_return=True)
+    async def func_b(a: int) -> int:
+        yield a
+
+    async def collect(agen):
+        return [item async for item in agen]
+
+    assert inspect.iscoroutinefunction(func_a)
+    assert inspect.isasyncgenfunction(func_b)
+    assert asyncio.run(func_a(1)) == 1
+    assert asyncio.run(collect(func_b(1))) == [1]
+    with pytest.raises(TypeMisMatch):
+        asyncio.run(func_a("1"))
+    with pytest.raises(TypeMisMatch):
+        asyncio.run(collect(func_b("1")))
+
+
+def test_lazy_match_class_typing():
+    @match_class_typing(lazy=True)
+    class Dummy:
+        def a(self, val: int):
+            return val
+
+        @staticmethod
+        def b(val: int):
+            return val
+
+    assert not hasattr(Dummy.a, "checker_plan")
+    assert Dummy().a(1) == 1
+    assert Dummy.b(2) == 2
+    with pytest.raises(TypeMisMatch):
+        Dummy().a("1")
+    with pytest.raises(TypeMisMatch):
+        Dummy.b("2")
+
+
+def test_invalid_options_raise_with_the_decoration():
+    with pytest.raises(ValueError):
+        match_typing(lazy=True, sample_rate=2)
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
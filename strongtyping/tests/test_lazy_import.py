@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import strongtyping
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFERRED_MODULES = ("inspect", "pprint", "json", "logging", "random", "threading", "linecache")
+
+
+def imported_modules(code: str) -> set:
+    """
+    :return: the modules imported by `code` in a new interpreter without site packages
+    """
+    completed = subprocess.run(
+        [sys.executable, "-S", "-c", f"import sys\n{code}\nprint(' '.join(sys.modules))"],
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+def test_import_defers_expensive_modules():
+    modules = imported_modules("import strongtyping.strong_typing")
+
+    assert "strongtyping.checker_plan" in modules
+    assert not modules.intersection(DEFERRED_MODULES)
+
+
+def test_import_of_the_typed_containers_defers_pprint():
+    modules = imported_modules("import strongtyping.types")
+
+    assert "strongtyping.types" in modules
+    assert "pprint" not in modules
+
+
+def test_import_of_the_package_imports_no_submodule():
+    modules = imported_modules("import strongtyping")
+
+    assert "strongtyping.strong_typing" not in modules
+    assert "typing" not in modules
+
+
+def test_lazy_attributes():
+    from strongtyping.strong_typing import match_typing
+    from strongtyping.types import TypedList
+
+    assert strongtyping.match_typing is match_typing
+    assert strongtyping.TypedList is TypedList
+    assert strongtyping.checker_plan.__name__ == "strongtyping.checker_plan"
+    assert "match_class_typing" in dir(strongtyping)
+    with pytest.raises(AttributeError):
+        strongtyping.not_existing
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
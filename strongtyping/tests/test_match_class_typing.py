@@ -82,5 +82,55 @@ def test_class_decorated_class_isinstance_is_proberly_working():
     assert isinstance(foo, Foo)
 
 
+def test_class_decorated_with_arguments_is_decorated_once():
+    @match_class_typing(cache_size=0)
+    class Foo:
+        def __init__(self, val: int = 10):
+            self.val = val
+
+        def bar(self, val: int):
+            return val
+
+    bar = Foo.bar
+    foo = Foo()
+
+    assert isinstance(foo, Foo)
+    assert Foo.bar is bar
+    assert Foo().bar(1) == 1
+    with pytest.raises(TypeMisMatch):
+        foo.bar("1")
+
+
+def test_class_is_decorated_only_once(monkeypatch):
+    from strongtyping import strong_typing
+
+    decorated_methods = []
+
+    def counting_match_typing(func, **kwargs):
+        decorated_methods.append(func.__name__)
+        return match_typing(func, **kwargs)
+
+    monkeypatch.setattr(strong_typing, "match_typing", counting_match_typing)
+
+    class Foo:
+        def __init__(self):
+            pass
+
+        def bar(self, val: int):
+            return val
+
+    decorated_cls = match_class_typing(cache_size=0)(Foo)
+    assert sorted(decorated_methods) == ["__init__", "bar"]
+
+    bar = decorated_cls.bar
+    for _ in range(5):
+        assert decorated_cls().bar(1) == 1
+    # creating instances neither scans the class nor wraps its methods again
+    assert sorted(decorated_methods) == ["__init__", "bar"]
+    assert decorated_cls.bar is bar
+    with pytest.raises(TypeMisMatch):
+        decorated_cls().bar("1")
+
+
 if __name__ == "__main__":
     pytest.main(["-vv", "-s", __file__])
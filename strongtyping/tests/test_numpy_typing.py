@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+from typing import Iterable, Union
+
+import pytest
+
+from strongtyping.numpy_typing import NDArray
+from strongtyping.strong_typing import match_typing
+from strongtyping.strong_typing_utils import TypeMisMatch, check_type
+
+np = pytest.importorskip("numpy")
+
+
+def test_ndarray_annotation():
+    @match_typing
+    def func_a(a: NDArray[float, (None, 3)], b: NDArray[np.integer] = None, c: NDArray = None):
+        return a.shape
+
+    assert func_a(np.zeros((2, 3))) == (2, 3)
+    assert func_a(np.zeros((2, 3), dtype=np.float32), np.arange(3, dtype=np.int8), np.ones(1))
+
+    with pytest.raises(TypeMisMatch):
+        func_a(np.zeros((2, 4)))
+    with pytest.raises(TypeMisMatch):
+        func_a(np.zeros((2, 3), dtype=np.int64))
+    with pytest.raises(TypeMisMatch):
+        func_a(np.zeros((2, 3)), np.zeros(3))
+    with pytest.raises(TypeMisMatch):
+        func_a([[1.0, 2.0, 3.0]])
+
+
+def test_ndarray_annotation_with_check_type():
+    assert check_type(np.zeros(3, dtype=np.float32), NDArray[np.float32])
+    assert not check_type(np.zeros(3), NDArray[np.float32])
+    assert check_type(np.zeros(3), NDArray[np.floating, 3])
+    assert not check_type(np.zeros(3), NDArray[int])
+    assert repr(NDArray[np.float32, (None, 3)]) == "NDArray[float32, (None, 3)]"
+    assert NDArray[float] == NDArray[float]
+
+
+@pytest.mark.parametrize("codegen", (False, True))
+def test_ndarray_as_iterable(codegen):
+    @match_typing(codegen=codegen)
+    def func_a(a: Iterable[int], b: Iterable[Union[int, float]] = ()):
+        return len(a)
+
+    assert func_a(np.arange(10_000_000), np.zeros(3)) == 10_000_000
+    with pytest.raises(TypeMisMatch):
+        func_a(np.zeros(3))
+    with pytest.raises(TypeMisMatch):
+        func_a(np.arange(3), np.array(["a"]))
+
+    assert check_type(np.arange(3), Iterable[int])
+    assert not check_type(np.arange(3), Iterable[str])
+    assert check_type(np.array([1, "a"], dtype=object), Iterable[Union[int, str]])
+
+
+def test_ndarray_for_plain_class():
+    @match_typing
+    def func_a(a: Union[NDArray[float], int]):
+        return a
+
+    with pytest.raises(TypeMisMatch):
+        func_a(np.arange(3))
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
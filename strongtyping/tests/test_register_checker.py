@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+from typing import Generic, List, TypeVar
+
+import pytest
+
+from strongtyping.strong_typing import match_typing
+from strongtyping.strong_typing_utils import (
+    TypeMisMatch,
+    check_type,
+    register_checker,
+    registered_checkers,
+    unregister_checker,
+)
+
+T = TypeVar("T")
+
+
+class Table(Generic[T]):
+    def __init__(self, *rows):
+        self.rows = rows
+
+
+class Model:
+    fields = {"name": str}
+
+    def __init__(self, **values):
+        self.values = values
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    yield
+    registered_checkers.clear()
+
+
+def check_model(arg, annotation):
+    return isinstance(arg, annotation) and all(
+        isinstance(arg.values.get(name), typ) for name, typ in annotation.fields.items()
+    )
+
+
+@pytest.mark.parametrize("codegen", (False, True))
+def test_register_checker_for_class(codegen):
+    register_checker(Model, check_model)
+
+    @match_typing(codegen=codegen)
+    def func_a(a: Model, b: List[Model] = ()):
+        return a
+
+    model = Model(name="a")
+    assert func_a(model, [model]) is model
+    with pytest.raises(TypeMisMatch):
+        func_a(Model(name=1))
+    with pytest.raises(TypeMisMatch):
+        func_a(model, [Model()])
+
+
+def test_register_checker_for_generic():
+    @register_checker(Table)
+    def check_table(arg, annotation):
+        (row_type,) = annotation.__args__
+        return isinstance(arg, Table) and all(isinstance(row, row_type) for row in arg.rows)
+
+    @match_typing
+    def func_a(a: Table[int]):
+        return a
+
+    assert check_type(Table(1, 2), Table[int])
+    assert not check_type(Table(1, "2"), Table[int])
+    assert func_a(Table(1))
+    with pytest.raises(TypeMisMatch):
+        func_a(Table("1"))
+
+
+def test_unregister_checker():
+    register_checker(Model, lambda arg, annotation: False)
+    assert not check_type(Model(), Model)
+
+    unregister_checker(Model)
+    assert check_type(Model(), Model)
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
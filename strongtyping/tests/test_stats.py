@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+import json
+from typing import List, Union
+
+import pytest
+
+from strongtyping.stats import FunctionStats, dump_stats, get_stats, reset_stats
+from strongtyping.strong_typing import match_class_typing, match_typing
+from strongtyping.strong_typing_utils import TypeMisMatch
+
+
+def test_stats_are_disabled_by_default():
+    @match_typing
+    def func_a(a: int):
+        return a
+
+    assert not hasattr(func_a, "stats")
+    assert get_stats(f"{__name__}.{func_a.__qualname__}") is None
+
+
+def test_stats_of_match_typing():
+    @match_typing(stats=True)
+    def func_a(a: int, b: List[int]):
+        return a
+
+    func_a.stats.reset()
+    func_a(1, [1])
+    func_a(1, [2])
+    with pytest.raises(TypeMisMatch):
+        func_a("1", [1])
+    with pytest.raises(TypeMisMatch):
+        func_a("1", ["1"])
+
+    stats = func_a.stats.as_dict()
+    assert stats["calls"] == 4
+    assert stats["checked_calls"] == 4
+    assert stats["failures"] == {"a": 2, "b": 1}
+    assert stats["check_time"] > 0
+    assert stats["check_time_p50"] <= stats["check_time_p99"]
+
+
+def test_stats_count_cache_hits():
+    @match_typing(stats=True)
+    def func_a(a: Union[int, List[int]]):
+        return a
+
+    func_a.stats.reset()
+    for _ in range(3):
+        func_a(1)
+
+    assert func_a.stats.cache_misses == 1
+    assert func_a.stats.cache_hits == 2
+    assert func_a.stats.checked_calls == 1
+    assert func_a.stats.calls == 3
+
+
+def test_stats_with_env(monkeypatch):
+    monkeypatch.setenv("ST_STATS", "1")
+
+    @match_class_typing
+    class Dummy:
+        def a(self, val: int):
+            return val
+
+    Dummy().a(1)
+
+    assert isinstance(Dummy.a.stats, FunctionStats)
+    assert Dummy.a.stats.calls >= 1
+
+
+def test_dump_and_reset_stats(tmp_path):
+    @match_typing(stats=True, cache_size=0)
+    def func_a(a: int):
+        return a
+
+    func_a(1)
+    name = f"{__name__}.{func_a.__qualname__}"
+    path = tmp_path / "stats.json"
+
+    assert get_stats(name) is func_a.stats
+    assert dump_stats(str(path))[name]["checked_calls"] >= 1
+    assert json.loads(path.read_text())[name]["checked_calls"] >= 1
+
+    reset_stats()
+    assert dump_stats()[name]["checked_calls"] == 0
+    assert func_a.stats.percentile(50) is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
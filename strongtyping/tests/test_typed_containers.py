@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@created: 18.10.26
+@author: felix
+"""
+from typing import Dict, List, Set
+
+import pytest
+
+from strongtyping.strong_typing import match_typing
+from strongtyping.strong_typing_utils import TypeMisMatch, check_type
+from strongtyping.types import TypedList, TypedMapping, TypedSet
+
+
+def test_typed_list():
+    values = TypedList[int]([1, 2])
+    values.append(3)
+    values.insert(0, 0)
+    values.extend([4])
+    values += [5]
+    values[0] = 6
+    values[1:2] = [7]
+
+    assert values == [6, 7, 2, 3, 4, 5]
+    assert repr(values) == "TypedList[int]([6, 7, 2, 3, 4, 5])"
+    assert TypedList[int] is TypedList[int]
+
+    for change in (
+        lambda: values.append("1"),
+        lambda: values.insert(0, "1"),
+        lambda: values.extend([1, "1"]),
+        lambda: values.__setitem__(0, "1"),
+        lambda: values.__setitem__(slice(0, 1), ["1"]),
+    ):
+        with pytest.raises(TypeMisMatch):
+            change()
+    assert values == [6, 7, 2, 3, 4, 5]
+
+    with pytest.raises(TypeMisMatch):
+        TypedList[int]([1, "2"])
+
+
+def test_typed_mapping():
+    values = TypedMapping[str, int]({"a": 1}, b=2)
+    values["c"] = 3
+    values.update(d=4)
+    values |= {"e": 5}
+    assert values.setdefault("f", 6) == 6
+
+    assert values == {"a": 1, "b": 2, "c": 3, "d": 4, "e": 5, "f": 6}
+
+    with pytest.raises(TypeMisMatch):
+        values[1] = 1
+    with pytest.raises(TypeMisMatch):
+        values.update(g="1")
+    with pytest.raises(TypeMisMatch):
+        values.setdefault("h")
+    with pytest.raises(TypeError):
+        TypedMapping[str]
+
+
+def test_typed_set():
+    values = TypedSet[int]({1})
+    values.add(2)
+    values.update([3], {4})
+    values |= {5}
+    values ^= {5, 6}
+
+    assert values == {1, 2, 3, 4, 6}
+
+    with pytest.raises(TypeMisMatch):
+        values.add("1")
+    with pytest.raises(TypeMisMatch):
+        values ^= {"1"}
+
+
+def test_typed_containers_are_accepted_without_iterating():
+    class CountingList(TypedList[int]):
+        def __iter__(self):
+            raise AssertionError("items must not be checked again")
+
+    @match_typing
+    def func_a(a: List[int], b: Dict[str, int], c: Set[int]):
+        return True
+
+    @match_typing(codegen=True)
+    def func_b(a: List[int], b: Dict[str, int], c: Set[int]):
+        return True
+
+    values = CountingList([1, 2])
+    mapping = TypedMapping[str, int](a=1)
+    items = TypedSet[int]({1})
+
+    assert func_a(values, mapping, items)
+    assert func_b(values, mapping, items)
+    assert check_type(values, List[int])
+
+
+def test_typed_containers_with_other_types_are_checked():
+    @match_typing
+    def func_a(a: List[int]):
+        return True
+
+    assert func_a(TypedList[bool]([True]))
+    with pytest.raises(TypeMisMatch):
+        func_a(TypedList[str](["1"]))
+    assert not check_type(TypedMapping[str, str](a="1"), Dict[str, int])
+
+    nested = TypedList[List[int]]([[1]])
+    assert not nested.known_valid
+    nested[0].append("1")
+    assert not check_type(nested, List[List[int]])
+
+
+if __name__ == "__main__":
+    pytest.main(["-vv", "-s", __file__])
@@ -4,6 +4,9 @@
 @created: 30.04.20
 @author: felix
 """
+import array
+import asyncio
+import inspect
 import json
 import os
 import sys
@@ -13,6 +16,7 @@ from enum import Enum, IntEnum
 from types import FunctionType, MethodType
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Dict,
     Generator,
@@ -31,10 +35,11 @@ from unittest import mock
 import pytest
 import ujson as ujson
 
-from strongtyping.config import SEVERITY_LEVEL
+from strongtyping.config import SEVERITY_LEVEL, set_severity_level, settings
 from strongtyping.strong_typing import match_class_typing, match_typing
 from strongtyping.strong_typing_utils import (
     TypeMisMatch,
+    check_type,
     checking_typing_dict,
     checking_typing_json,
     checking_typing_list,
@@ -44,6 +49,7 @@ from strongtyping.strong_typing_utils import (
     get_origins,
     get_possible_types,
 )
+from strongtyping.types import Validator
 
 try:
     from typing import Literal
@@ -51,6 +57,20 @@ except ImportError:
     print("python version < 3.8")
 
 
+@pytest.fixture
+def env_severity(monkeypatch):
+    """
+    sets `ST_SEVERITY` and takes it over into the settings, both are restored after the test
+    """
+    monkeypatch.setattr(settings, "severity", settings.severity)
+
+    def set_env_severity(level: str):
+        monkeypatch.setenv("ST_SEVERITY", level)
+        settings.refresh()
+
+    return set_env_severity
+
+
 def test_get_possible_types_from_typing():
     # using pytest.mark.parametrize is also an option but for the moment this is fine also
     assert get_possible_types(List[str]) == (str,)
@@ -1038,8 +1058,8 @@ def test_with_severity_param():
         assert od.a("2") == "222"
 
 
-def test_with_env_severity(monkeypatch):
-    monkeypatch.setenv("ST_SEVERITY", "disable")
+def test_with_env_severity(env_severity):
+    env_severity("disable")
 
     @match_class_typing
     class Dummy:
@@ -1057,7 +1077,7 @@ def test_with_env_severity(monkeypatch):
 
     assert some_func(3, ["a", "b", "c"]) == ["aaa", "bbb", "ccc"]
 
-    monkeypatch.setenv("ST_SEVERITY", "warning")
+    env_severity("warning")
 
     @match_class_typing
     class Dummy:
@@ -1078,8 +1098,284 @@ def test_with_env_severity(monkeypatch):
         assert some_func(3, ["a", "b", "c"]) == ["aaa", "bbb", "ccc"]
 
 
-def test_classmethod_staticmethod(monkeypatch):
-    monkeypatch.setenv("ST_SEVERITY", "warning")
+def test_with_strip_severity(env_severity):
+    def some_func(val: int):
+        return val
+
+    class Dummy:
+        def a(self, val: int):
+            return val
+
+    assert match_typing(some_func, severity=SEVERITY_LEVEL.STRIP) is some_func
+    assert match_class_typing(Dummy, severity=SEVERITY_LEVEL.STRIP) is Dummy
+    assert not hasattr(Dummy, "_matches_class")
+    assert Dummy.__dict__["a"].__name__ == "a"
+    assert not hasattr(Dummy.a, "__fe_strng_mtch__")
+
+    env_severity("strip")
+    assert match_typing(some_func) is some_func
+    assert match_typing()(some_func) is some_func
+    assert match_class_typing(Dummy) is Dummy
+
+
+def test_with_live_severity(monkeypatch, env_severity):
+    env_severity("enable")
+
+    @match_typing
+    def some_func(val: int):
+        return val
+
+    @match_typing(severity=SEVERITY_LEVEL.ENABLED)
+    def fixed_func(val: int):
+        return val
+
+    @match_class_typing
+    class Dummy:
+        def a(self, val: int):
+            return val
+
+    with pytest.raises(TypeMisMatch):
+        some_func("1")
+
+    set_severity_level(SEVERITY_LEVEL.DISABLED)
+    assert some_func("1") == "1"
+    assert Dummy().a("1") == "1"
+    with pytest.raises(TypeMisMatch):
+        fixed_func("1")
+
+    settings.severity = SEVERITY_LEVEL.WARNING.value
+    with pytest.warns(RuntimeWarning):
+        assert some_func("1") == "1"
+
+    set_severity_level(SEVERITY_LEVEL.ENABLED)
+    with pytest.raises(TypeMisMatch):
+        Dummy().a("1")
+
+    # the calls only read the settings and not the environment
+    monkeypatch.setenv("ST_SEVERITY", "disable")
+    with pytest.raises(TypeMisMatch):
+        some_func("1")
+    settings.refresh()
+    assert some_func("1") == "1"
+
+
+def test_with_check_return():
+    @match_typing(check_return=True)
+    def func_a(a: int) -> List[int]:
+        return [a] * a if a else ["0"]
+
+    assert func_a(2) == [2, 2]
+    with pytest.raises(TypeMisMatch) as excinfo:
+        func_a(0)
+    assert "Incorrect return value" in str(excinfo.value)
+
+    @match_typing(check_return=True, codegen=True)
+    def func_b(a) -> None:
+        return a
+
+    assert func_b(None) is None
+    with pytest.raises(TypeMisMatch):
+        func_b(1)
+
+    @match_typing
+    def func_c(a: int) -> str:
+        return a
+
+    assert func_c(1) == 1
+
+
+def test_with_check_return_cache():
+    @match_typing(check_return=True, severity=SEVERITY_LEVEL.WARNING)
+    def func_a(a: Any) -> int:
+        return a
+
+    assert func_a(1) == 1
+    assert func_a(1) == 1
+    assert func_a.checker_plan.return_fingerprint(1) == ("return", int)
+    with pytest.warns(RuntimeWarning):
+        assert func_a("1") == "1"
+
+
+def test_with_check_return_validator_default():
+    @match_typing(check_return=True)
+    def func_a(a: Any) -> Validator[int, lambda x: x > 0, 5]:
+        return a
+
+    assert func_a(1) == 1
+    assert func_a(-1) == 5
+    assert func_a(0) == 5
+
+    @match_typing(check_return=True, codegen=True)
+    async def func_b(a: Any) -> Validator[int, lambda x: x > 0, 5]:
+        return a
+
+    assert asyncio.run(func_b(-1)) == 5
+
+
+def test_with_coroutine():
+    @match_typing(check_return=True)
+    async def func_a(a: int) -> List[int]:
+        await asyncio.sleep(0)
+        return [a] if a else ["0"]
+
+    assert inspect.iscoroutinefunction(func_a)
+    assert asyncio.run(func_a(1)) == [1]
+    with pytest.raises(TypeMisMatch):
+        asyncio.run(func_a("1"))
+    with pytest.raises(TypeMisMatch):
+        asyncio.run(func_a(0))
+
+    @match_class_typing
+    class Dummy:
+        async def a(self, val: int):
+            return val
+
+    assert inspect.iscoroutinefunction(Dummy.a)
+    assert asyncio.run(Dummy().a(2)) == 2
+    with pytest.raises(TypeMisMatch):
+        asyncio.run(Dummy().a("2"))
+
+
+def test_with_async_generator():
+    @match_typing(check_return=True)
+    async def func_a(count: int) -> AsyncIterator[int]:
+        for val in range(count):
+            received = yield val
+            if received is not None:
+                yield str(received)
+
+    async def consume(count):
+        return [val async for val in func_a(count)]
+
+    async def send():
+        agen = func_a(2)
+        assert await agen.__anext__() == 0
+        await agen.asend(1)
+
+    assert inspect.isasyncgenfunction(func_a)
+    assert asyncio.run(consume(3)) == [0, 1, 2]
+    with pytest.raises(TypeMisMatch):
+        asyncio.run(consume("3"))
+    with pytest.raises(TypeMisMatch):
+        asyncio.run(send())
+
+
+@pytest.mark.parametrize("codegen", (False, True))
+def test_buffers_as_iterable(codegen):
+    @match_typing(codegen=codegen)
+    def func_a(a: Iterable[int]):
+        return len(a)
+
+    assert func_a(bytes(1_000_000)) == 1_000_000
+    assert func_a(bytearray(b"abc")) == 3
+    assert func_a(array.array("q", range(10))) == 10
+    assert func_a(memoryview(array.array("i", range(10)))) == 10
+    with pytest.raises(TypeMisMatch):
+        func_a(array.array("d", [1.0]))
+    with pytest.raises(TypeMisMatch):
+        func_a(memoryview(b"abc").cast("c"))
+
+    assert check_type(memoryview(b"abc").cast("c"), Iterable[bytes])
+    assert check_type(array.array("u", "abc"), Iterable[str])
+    assert not check_type(b"abc", Iterable[bytes])
+
+
+def test_with_wrap_iterators():
+    @match_typing(wrap_iterators=True)
+    def func_a(a: Iterator[int], b: Generator[str, None, None] = None):
+        return list(a), list(b or ())
+
+    assert func_a(iter([1, 2]), b=(val for val in "ab")) == ([1, 2], ["a", "b"])
+    assert func_a((val for val in range(3))) == ([0, 1, 2], [])
+    with pytest.raises(TypeMisMatch):
+        func_a([1, 2])
+    with pytest.raises(TypeMisMatch):
+        func_a(val for val in [1, "2"])
+    with pytest.raises(TypeMisMatch):
+        func_a(iter([1]), b=iter([1]))
+
+    consumed = []
+
+    def generator():
+        for val in (1, 2, "3", 4):
+            consumed.append(val)
+            yield val
+
+    @match_typing(wrap_iterators=True)
+    def func_b(a: Iterable[int]):
+        return next(a), next(a)
+
+    assert func_b(generator()) == (1, 2)
+    assert consumed == [1, 2]
+
+    @match_typing
+    def func_c(a: Iterator[int]):
+        return list(a)
+
+    assert func_c(val for val in [1, "2"]) == [1, "2"]
+
+
+def test_with_wrap_iterators_send():
+    def echo():
+        value = yield 0
+        while True:
+            value = yield value
+
+    @match_typing(wrap_iterators=True, severity=SEVERITY_LEVEL.WARNING)
+    def func_a(a: Generator[int, int, None]):
+        next(a)
+        return a.send(1), a.send("2")
+
+    with pytest.warns(RuntimeWarning):
+        assert func_a(echo()) == (1, "2")
+
+
+def test_with_sample_rate():
+    @match_typing(sample_rate=0.25)
+    def some_func(val: int):
+        return val
+
+    results = []
+    for _ in range(8):
+        try:
+            results.append(some_func("1"))
+        except TypeMisMatch:
+            results.append(None)
+
+    assert results == ["1", "1", "1", None, "1", "1", "1", None]
+
+    @match_typing(sample_rate=0)
+    def other_func(val: int):
+        return val
+
+    assert other_func("1") == "1"
+
+    with pytest.raises(ValueError):
+        match_typing(sample_rate=2)(other_func)
+
+
+def test_with_env_sample_rate(monkeypatch):
+    monkeypatch.setenv("ST_SAMPLE_RATE", "0")
+
+    @match_class_typing
+    class Dummy:
+        def a(self, val: int):
+            return val * 3
+
+    assert Dummy().a("2") == "222"
+
+    monkeypatch.setenv("ST_SAMPLE_RATE", "1")
+
+    @match_typing
+    def some_func(val: int):
+        return val
+
+    with pytest.raises(TypeMisMatch):
+        some_func("1")
+
+
+def test_classmethod_staticmethod(env_severity):
+    env_severity("warning")
 
     @match_class_typing
     class Dummy:
@@ -249,5 +249,29 @@ def test_iter_validator():
         cluster([1, 2, fractions.Fraction(3, 2)])  # non int fraction
 
 
+@pytest.mark.skipif(
+    bool(int(os.environ["ST_MODULES_INSTALLED"])) is True,
+    reason="module does not support Validator at the moment",
+)
+@pytest.mark.skipif(sys.version_info.minor < 9, reason="Available since 3.9")
+def test_validator_default_belongs_to_its_call():
+    from concurrent.futures import ThreadPoolExecutor
+
+    @match_typing
+    def foo(val_a: Validator[int, lambda x: x > 0, "foo"]):
+        return True
+
+    @match_typing
+    def bar(val_a: Validator[int, lambda x: x > 0, "bar"]):
+        return True
+
+    calls = [(foo, 1, True), (foo, -1, "foo"), (bar, 1, True), (bar, -1, "bar")] * 500
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda call: call[0](call[1]), calls))
+
+    assert results == [expected for _, _, expected in calls]
+
+
 if __name__ == "__main__":
     pytest.main(["-vv", "-s", __file__])
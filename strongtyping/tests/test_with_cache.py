@@ -5,9 +5,8 @@
 @author: felix
 """
 import operator
-import timeit
 from functools import partial
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import pytest
 
@@ -54,6 +53,62 @@ def test_class_with_cache():
         my_class.foo([2, 4, 6, 8], "2")
 
 
+def test_cache_does_not_skip_changed_lists():
+    @match_typing(cache_size=1)
+    def foo(val_a: List[int]):
+        return val_a
+
+    data = [1, 2, 3]
+    assert foo(data) == [1, 2, 3]
+
+    data.append("4")
+    with pytest.raises(TypeMisMatch):
+        foo(data)
+
+
+def test_cache_key_is_structural():
+    @match_typing(cache_size=1)
+    def foo(val_a: int, val_b: List[int], val_c: Tuple[int, ...]):
+        return val_a
+
+    plan = foo.checker_plan
+    assert plan.fingerprint((1, [1], (1,)), {}) is None
+    assert plan.fingerprint((1,), {}) == (int, 1)
+    assert plan.fingerprint((1,), {"val_c": (1,)}) is None
+
+    data = tuple(range(10))
+    assert plan.fingerprint((1, list(data)), {}, identity=True) is None
+    assert plan.fingerprint((1,), {"val_c": data}, identity=True) == plan.fingerprint(
+        (2,), {"val_c": data}, identity=True
+    )
+
+
+def test_cache_only_for_checks_worth_caching():
+    @match_typing(cache_size=1, stats=True)
+    def func_a(val_a: int, val_b: Optional[str] = None):
+        return val_a
+
+    @match_typing(cache_size=1, stats=True)
+    def func_b(val_a: int, val_b: Tuple[int, ...]):
+        return val_a
+
+    @match_typing(cache_size=1)
+    def func_c(val_a: int, val_b: List[int]):
+        return val_a
+
+    assert not func_a.checker_plan.worth_caching
+    assert func_b.checker_plan.worth_caching
+    # a list argument never results in a cache key
+    assert not func_c.checker_plan.worth_caching
+
+    func_a.stats.reset()
+    for _ in range(3):
+        assert func_a(1, "a") == 1
+    # plain isinstance checks are cheaper than the lookup, so they are never cached
+    assert func_a.stats.cache_hits == func_a.stats.cache_misses == 0
+    assert func_a.stats.checked_calls == 3
+
+
 @match_typing(cache_size=0)
 def foo(val_a: List[int], val_b: Optional[int] = 10):
     return list(map(partial(operator.mul, val_b), val_a))
@@ -80,21 +135,45 @@ data_1 = list(range(100))
 
 
 def test_cache_enabled_will_boost():
-    assert timeit.timeit("foo(data_1)", globals=globals(), number=1000) > timeit.timeit(
-        "foo_cached(data_1)", globals=globals(), number=1000
-    )
-
-    assert timeit.timeit("foo(data_1, 10)", globals=globals(), number=1000) > timeit.timeit(
-        "foo_cached(data_1, 10)", globals=globals(), number=1000
-    )
-
-    assert timeit.timeit("MyClass().foo(data_1)", globals=globals(), number=1000) > timeit.timeit(
-        "MyClassCached().foo(data_1)", globals=globals(), number=1000
-    )
-
-    assert timeit.timeit(
-        "MyClass().foo(data_1, 10)", globals=globals(), number=1000
-    ) > timeit.timeit("MyClassCached().foo(data_1, 10)", globals=globals(), number=1000)
+    assert foo(data_1) == foo_cached(data_1)
+    assert foo(data_1, 10) == foo_cached(data_1, 10)
+    assert MyClass().foo(data_1) == MyClassCached().foo(data_1)
+    assert MyClass().foo(data_1, 10) == MyClassCached().foo(data_1, 10)
+
+    @match_typing(cache_size=1, cache_identity=True, stats=True)
+    def func_a(val_a: Tuple[int, ...], val_b: Optional[int] = 10):
+        return val_a
+
+    @match_typing(cache_size=1, stats=True)
+    def func_b(val_a: List[int], val_b: Optional[int] = 10):
+        return val_a
+
+    data = tuple(data_1)
+    func_a.stats.reset()
+    func_b.stats.reset()
+    for _ in range(10):
+        func_a(data)
+        func_a(data, 10)
+        func_b(data_1)
+
+    # only the first call of each structure is checked, the others are cache hits
+    assert func_a.stats.checked_calls == 2
+    assert func_a.stats.cache_hits == 18
+    # a list can be changed between two calls, so it is checked every time
+    assert func_b.stats.checked_calls == 10
+    assert func_b.stats.cache_hits == 0
+
+
+def test_cache_identity_with_mutable_items():
+    @match_typing(cache_size=1, cache_identity=True)
+    def func_a(val_a: Tuple[List[int], ...]):
+        return val_a
+
+    items = ([1], [2])
+    assert func_a(items) is items
+    items[0].append("x")
+    with pytest.raises(TypeMisMatch):
+        func_a(items)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,8 @@ import weakref
 from functools import partial
 from typing import Any, _GenericAlias, _SpecialForm, _type_repr
 
-from strongtyping.strong_typing_utils import py_version
+from strongtyping.checker_plan import compile_checker
+from strongtyping.strong_typing_utils import TypeMisMatch, py_version
 
 
 class _Validator(_GenericAlias, _root=True):  # type: ignore
@@ -152,3 +153,151 @@ class FrozenType:
             f"`{attribute_name}` is a final type. "
             f"\n\tYou cannot assign {type(value)} to {self.required_type}"
         )
+
+
+_typed_classes: dict = {}
+
+
+class TypedContainer:
+    """
+    Base of the containers which check their items with every change,
+    so `match_typing` can accept them without checking all items again
+    """
+
+    __slots__ = ()
+    parameters = 1
+    item_types: tuple = ()
+    item_checkers: tuple = ()
+    # True if the items cannot become invalid without a change of the container itself
+    known_valid = False
+
+    def __class_getitem__(cls, item_types):
+        if not isinstance(item_types, tuple):
+            item_types = (item_types,)
+        if len(item_types) != cls.parameters:
+            raise TypeError(f"{cls.__name__} takes {cls.parameters} type(s)")
+        key = (cls, item_types)
+        if key not in _typed_classes:
+            item_checkers = tuple(compile_checker(item_type) for item_type in item_types)
+            name = f"{cls.__name__}[{', '.join(_type_repr(typ) for typ in item_types)}]"
+            _typed_classes[key] = type(cls)(
+                name,
+                (cls,),
+                {
+                    "__slots__": (),
+                    "__module__": cls.__module__,
+                    "__qualname__": name,
+                    "item_types": item_types,
+                    "item_checkers": item_checkers,
+                    "known_valid": all(checker.type_determined for checker in item_checkers),
+                },
+            )
+        return _typed_classes[key]
+
+    def check_item(self, item, index: int = 0):
+        if self.item_checkers and not self.item_checkers[index](item):
+            # pprint is only imported when there is an error message
+            import pprint
+
+            raise TypeMisMatch(
+                f"Incorrect item: `{pprint.pformat(item, width=20, depth=2)}`"
+                f"\n\trequired: {_type_repr(self.item_types[index])}"
+            )
+        return item
+
+
+class TypedList(TypedContainer, list):
+    """
+    TypedList[int]([1, 2]), checks the items with append, extend, insert, += and assignments
+    """
+
+    __slots__ = ()
+
+    def __init__(self, iterable=()):
+        super().__init__([self.check_item(item) for item in iterable])
+
+    def append(self, item):
+        super().append(self.check_item(item))
+
+    def insert(self, index, item):
+        super().insert(index, self.check_item(item))
+
+    def extend(self, iterable):
+        super().extend([self.check_item(item) for item in iterable])
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [self.check_item(item) for item in value]
+        else:
+            self.check_item(value)
+        super().__setitem__(index, value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list.__repr__(self)})"
+
+
+class TypedMapping(TypedContainer, dict):
+    """
+    TypedMapping[str, int]({"a": 1}), checks keys and values with assignments, update and setdefault
+    """
+
+    __slots__ = ()
+    parameters = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(self.check_item(key, 0), self.check_item(value, 1))
+
+    def update(self, *args, **kwargs):
+        items = dict(*args, **kwargs)
+        for key, value in items.items():
+            self.check_item(key, 0)
+            self.check_item(value, 1)
+        super().update(items)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+
+class TypedSet(TypedContainer, set):
+    """
+    TypedSet[int]({1, 2}), checks the items with add, update, |= and ^=
+    """
+
+    __slots__ = ()
+
+    def __init__(self, iterable=()):
+        super().__init__([self.check_item(item) for item in iterable])
+
+    def add(self, item):
+        super().add(self.check_item(item))
+
+    def update(self, *iterables):
+        super().update(*([self.check_item(item) for item in items] for items in iterables))
+
+    def symmetric_difference_update(self, iterable):
+        super().symmetric_difference_update([self.check_item(item) for item in iterable])
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self